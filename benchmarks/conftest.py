@@ -0,0 +1,72 @@
+"""Pytest configuration for health_check benchmarks."""
+
+import asyncio
+import dataclasses
+
+import pytest
+from django.test import AsyncRequestFactory
+
+from health_check.base import HealthCheck
+from health_check.views import HealthCheckView
+
+#: Number of checks per view that each benchmark is run with.
+CHECK_COUNTS = [1, 10, 100, 1000]
+
+
+@dataclasses.dataclass
+class NoOp(HealthCheck):
+    """Check that does nothing, to measure the overhead of the package."""
+
+    index: int = 0
+
+    async def run(self):
+        pass
+
+
+@dataclasses.dataclass
+class SyncNoOp(HealthCheck):
+    """Synchronous check that does nothing, to include the thread pool overhead."""
+
+    index: int = 0
+
+    def run(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """Return an event loop that is reused across all rounds of a benchmark."""
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.fixture
+def get_health(loop):
+    """Return a function that requests a view with the given number of checks."""
+    factory = AsyncRequestFactory()
+
+    def get_health(count, check_class=NoOp, *, path="/", headers=None, **initkwargs):
+        view = HealthCheckView.as_view(
+            checks=[(check_class, {"index": index}) for index in range(count)],
+            **initkwargs,
+        )
+        request = factory.get(path, headers=headers)
+
+        def get():
+            response = loop.run_until_complete(view(request))
+            if hasattr(response, "render"):
+                response.render()
+            if response.streaming:
+                loop.run_until_complete(consume(response.streaming_content))
+            return response
+
+        return get
+
+    return get_health
+
+
+async def consume(content):
+    """Read a streaming response's content to its end."""
+    async for _ in content:
+        pass
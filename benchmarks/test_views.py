@@ -0,0 +1,57 @@
+"""Benchmarks for the overhead of the health check view and its renderers."""
+
+import pytest
+
+from benchmarks.conftest import CHECK_COUNTS, SyncNoOp
+from health_check.views import MediaType
+
+#: Accept headers as they are sent by browsers, monitoring tools and scripts.
+ACCEPT_HEADERS = {
+    "browser": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "prometheus": "application/openmetrics-text;version=1.0.0;escaping=allow-utf-8;q=0.6,application/openmetrics-text;version=0.0.1;q=0.5,text/plain;version=1.0.0;escaping=allow-utf-8;q=0.4,text/plain;version=0.0.4;q=0.3,*/*;q=0.2",
+    "curl": "*/*",
+    "json": "application/json",
+    "feed_reader": "application/rss+xml, application/rdf+xml;q=0.8, application/atom+xml;q=0.6, application/xml;q=0.4, text/xml;q=0.4",
+}
+
+
+@pytest.mark.parametrize("count", CHECK_COUNTS)
+@pytest.mark.parametrize(
+    "format_param",
+    ["html", "json", "text", "atom", "rss", "openmetrics", "ndjson", "health"],
+)
+def test_get(benchmark, get_health, format_param, count):
+    """Request the view end to end with the given number of no-op checks."""
+    benchmark.group = f"get[{format_param}]"
+    benchmark.extra_info["checks"] = count
+    path = "/" if format_param == "html" else f"/?format={format_param}"
+    response = benchmark(get_health(count, path=path))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("count", CHECK_COUNTS)
+def test_get__sync_checks(benchmark, get_health, count):
+    """Request the view with synchronous no-op checks, that are run in threads."""
+    benchmark.group = "get[sync]"
+    benchmark.extra_info["checks"] = count
+    response = benchmark(get_health(count, SyncNoOp, path="/?format=json"))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("count", CHECK_COUNTS)
+@pytest.mark.parametrize("client", list(ACCEPT_HEADERS))
+def test_get__accept(benchmark, get_health, client, count):
+    """Request the view with content negotiation by a realistic Accept header."""
+    benchmark.group = f"get[accept={client}]"
+    benchmark.extra_info["checks"] = count
+    response = benchmark(get_health(count, headers={"Accept": ACCEPT_HEADERS[client]}))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("client", list(ACCEPT_HEADERS))
+def test_media_type__parse_header(benchmark, client):
+    """Parse a realistic Accept header into media types sorted by preference."""
+    benchmark.group = "MediaType.parse_header"
+    assert benchmark(
+        lambda header: list(MediaType.parse_header(header)), ACCEPT_HEADERS[client]
+    )
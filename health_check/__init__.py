@@ -2,7 +2,7 @@
 
 from . import _version  # noqa
 from .base import HealthCheck
-from .checks import Cache, DNS, Database, Mail, Storage
+from .checks import Cache, DNS, Database, EventLoopLag, Mail, Storage
 
 __version__ = _version.__version__
 VERSION = _version.__version_tuple__
@@ -14,6 +14,7 @@ __all__ = [
     "Cache",
     "DNS",
     "Database",
+    "EventLoopLag",
     "Mail",
     "Storage",
 ]
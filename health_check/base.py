@@ -2,24 +2,104 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import contextlib
+import contextvars
 import dataclasses
+import datetime
+import functools
 import inspect
 import logging
+import time
 import timeit
-from concurrent.futures import Executor
+import typing
+from concurrent.futures import Executor, Future
 
-from health_check.exceptions import HealthCheckException
+from django.utils import timezone
+
+from health_check import hooks, metrics
+from health_check.exceptions import HealthCheckException, ServiceUnavailable
+from health_check.executor import get_shared_executor
 
 logger = logging.getLogger(__name__)
 
+# Executor runs that exceeded their timeout by the representation of their check.
+# Threads can't be interrupted, so a check isn't run again until its previous run ended.
+_abandoned_runs: dict[str, Future] = {}
+
+
+def _forget_abandoned_run(key: str, future: Future) -> None:
+    if _abandoned_runs.get(key) is future:
+        del _abandoned_runs[key]
+
+
+# Time taken by the named phases of the check running in the current context.
+_phases: contextvars.ContextVar[dict[str, float]] = contextvars.ContextVar("phases")
+
+
+@dataclasses.dataclass
+class _RunTiming:
+    """Timings recorded by the thread or task running a check."""
+
+    cpu_time: bool = False
+    started: float | None = None
+    cpu_seconds: float | None = None
+
+
+class _CPUTimed:
+    """Awaitable recording the CPU time of the thread while the coroutine is running."""
+
+    def __init__(self, coro: typing.Coroutine, timing: _RunTiming):
+        self.coro = coro
+        self.timing = timing
+
+    def __await__(self):
+        self.timing.cpu_seconds = 0.0
+        value, error = None, None
+        while True:
+            start = time.thread_time()
+            try:
+                if error is None:
+                    future = self.coro.send(value)
+                else:
+                    future = self.coro.throw(error)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self.timing.cpu_seconds += time.thread_time() - start
+            # Other tasks use the thread while the coroutine is suspended.
+            try:
+                value, error = (yield future), None
+            except GeneratorExit:
+                self.coro.close()
+                raise
+            except BaseException as e:
+                value, error = None, e
+
 
 @dataclasses.dataclass
 class HealthCheckResult:
-    """Result of a health check execution."""
+    """
+    Result of a health check execution.
+
+    Attributes:
+        check: The check that was run.
+        error: The error raised by the check or None if it succeeded.
+        time_taken: Time from requesting a run until the check finished in seconds.
+        queued_seconds: Time the check waited for a thread or the concurrency limit in seconds.
+        run_seconds: Time the check's `run` method took in seconds.
+        cpu_seconds: CPU time the check's `run` method used in its thread in seconds,
+            or None if it wasn't measured.
+        phases: Time taken by the named phases of the check in seconds.
+
+    """
 
     check: HealthCheck
     error: HealthCheckException | None
     time_taken: float
+    queued_seconds: float = 0.0
+    run_seconds: float = 0.0
+    cpu_seconds: float | None = None
+    phases: dict[str, float] = dataclasses.field(default_factory=dict)
 
 
 @dataclasses.dataclass
@@ -48,8 +128,23 @@ class HealthCheck(abc.ABC):
         Consider setting `repr=False` for sensitive dataclass fields
         to avoid leaking sensitive information or credentials.
 
+    Attributes:
+        refresh_interval: Time between background runs of the check,
+            if the view schedules its checks, or None to use the view's interval.
+        node_local: Whether the check's result is specific to the machine it runs on
+            and must not be shared with other machines.
+        max_concurrency: Maximum number of concurrent runs of the check type,
+            if the view limits its concurrency, or None for no specific limit.
+        critical: Whether a failure of the check skips all pending checks,
+            if the view fails fast. Warnings never skip other checks.
+
     """
 
+    refresh_interval: typing.ClassVar[datetime.timedelta | None] = None
+    node_local: typing.ClassVar[bool] = False
+    max_concurrency: typing.ClassVar[int | None] = None
+    critical: typing.ClassVar[bool] = True
+
     @abc.abstractmethod
     async def run(self) -> None:
         """
@@ -74,9 +169,14 @@ class HealthCheck(abc.ABC):
         """Return a human-readable status string, always 'OK' for the check itself."""
         return "OK"
 
-    @property
+    @functools.cached_property
     def labels(self) -> dict[str, str]:
-        """Return a human-readable label for the check, defaulting to the class name."""
+        """
+        Return a human-readable label for the check, defaulting to the class name.
+
+        Labels are computed once per check instance, since checks are configured
+        when they are created and are not changed afterward.
+        """
         return {
             "check": self.__class__.__name__,
         } | {
@@ -85,22 +185,159 @@ class HealthCheck(abc.ABC):
             if field.repr and (value := getattr(self, field.name)) is not None
         }
 
-    async def get_result(self, executor: Executor | None = None) -> HealthCheckResult:
-        loop = asyncio.get_running_loop()
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Generator[None, None, None]:
+        """
+        Record the time taken by a named phase of the check's `run` method.
+
+        Phases are reported with the check's result. The time of phases
+        sharing the same name is added up.
+
+        Examples:
+            >>> def run(self):
+            ...     with self.phase("connect"):
+            ...         connection = self.connect()
+            ...     with self.phase("query"):
+            ...         connection.execute("SELECT 1")
+
+        Args:
+            name: The name of the phase.
+
+        """
+        try:
+            phases = _phases.get()
+        except LookupError:
+            # The check isn't run via get_result, there is nobody to report to.
+            yield
+            return
+        start = timeit.default_timer()
+        try:
+            yield
+        finally:
+            phases[name] = phases.get(name, 0.0) + timeit.default_timer() - start
+
+    async def get_result(
+        self,
+        executor: Executor | None = None,
+        timeout: datetime.timedelta | None = None,
+        *,
+        cpu_time: bool = False,
+        queued_seconds: float = 0.0,
+    ) -> HealthCheckResult:
+        """
+        Run the check and return its result.
+
+        Args:
+            executor: Executor for synchronous checks or None for the loop's default
+                executor, or a process-wide executor if a timeout is given.
+            timeout: Time after which the check is considered unavailable or None to wait indefinitely.
+            cpu_time: Whether to measure the CPU time the check used in its thread,
+                or in the event loop's thread while an asynchronous check was running.
+            queued_seconds: Time the run already waited before this call,
+                e.g. for a concurrency limit, to include in the time taken.
+
+        """
+        phases = {}
+        token = _phases.set(phases)
+        started_at = timezone.now()
+        hooks.dispatcher.send(hooks.check_started, self, started_at=started_at)
         start = timeit.default_timer()
+        timing = _RunTiming(cpu_time=cpu_time)
         try:
-            await self.run() if inspect.iscoroutinefunction(
-                self.run
-            ) else await loop.run_in_executor(executor, self.run)
+            if inspect.iscoroutinefunction(self.run):
+                timing.started = start
+                await self._run_async(timeout, timing)
+            else:
+                await self._run_in_executor(executor, timeout, timing)
         except HealthCheckException as e:
             error = e
+        except asyncio.CancelledError:
+            raise
         except BaseException:
             logger.exception("Unexpected exception during health check")
             error = HealthCheckException("unknown error")
         else:
             error = None
-        return HealthCheckResult(
+        finally:
+            _phases.reset(token)
+        end = timeit.default_timer()
+        time_taken = queued_seconds + end - start
+        # Synchronous checks may time out before a thread picked them up.
+        queued_seconds += (end if timing.started is None else timing.started) - start
+        metrics.response_time.observe(tuple(self.labels.items()), time_taken)
+        result = HealthCheckResult(
             check=self,
             error=error,
-            time_taken=timeit.default_timer() - start,
+            time_taken=time_taken,
+            queued_seconds=queued_seconds,
+            run_seconds=time_taken - queued_seconds,
+            cpu_seconds=timing.cpu_seconds,
+            # Copy, since a timed-out synchronous run may still record phases.
+            phases=dict(phases),
+        )
+        hooks.dispatcher.send(
+            hooks.check_finished,
+            self,
+            started_at=started_at,
+            result=result,
+            error=error,
+        )
+        return result
+
+    def _run_sync(self, timing: _RunTiming) -> None:
+        timing.started = timeit.default_timer()
+        if not timing.cpu_time:
+            self.run()
+            return
+        start = time.thread_time()
+        try:
+            self.run()
+        finally:
+            timing.cpu_seconds = time.thread_time() - start
+
+    async def _run_async(
+        self, timeout: datetime.timedelta | None, timing: _RunTiming
+    ) -> None:
+        coro = self.run()
+        if timing.cpu_time:
+            coro = self._await(_CPUTimed(coro, timing))
+        try:
+            await asyncio.wait_for(
+                coro, None if timeout is None else timeout.total_seconds()
+            )
+        except asyncio.TimeoutError as e:
+            raise ServiceUnavailable("timeout") from e
+
+    @staticmethod
+    async def _await(awaitable: typing.Awaitable) -> typing.Any:
+        return await awaitable
+
+    async def _run_in_executor(
+        self,
+        executor: Executor | None,
+        timeout: datetime.timedelta | None,
+        timing: _RunTiming,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        # Executors don't propagate context variables, like the recorded phases.
+        context = contextvars.copy_context()
+        if timeout is None:
+            await loop.run_in_executor(executor, context.run, self._run_sync, timing)
+            return
+        key = repr(self)
+        match _abandoned_runs.get(key):
+            case Future() as pending if not pending.done():
+                raise ServiceUnavailable("timeout")
+        # Closing a loop waits for the threads of its default executor, e.g. after
+        # each request under WSGI, so timed runs must not occupy them.
+        future = (executor or get_shared_executor(None)).submit(
+            context.run, self._run_sync, timing
         )
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), timeout.total_seconds()
+            )
+        except asyncio.TimeoutError as e:
+            _abandoned_runs[key] = future
+            future.add_done_callback(functools.partial(_forget_abandoned_run, key))
+            raise ServiceUnavailable("timeout") from e
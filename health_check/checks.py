@@ -1,5 +1,6 @@
 """Health check implementations for Django built-in services."""
 
+import asyncio
 import dataclasses
 import datetime
 import logging
@@ -21,10 +22,12 @@ from django.db import connections
 from django.db.models import Expression
 from django.utils.connection import ConnectionDoesNotExist
 
+from health_check import metrics
 from health_check.base import HealthCheck
 from health_check.exceptions import (
     ServiceReturnedUnexpectedResult,
     ServiceUnavailable,
+    ServiceWarning,
 )
 
 try:
@@ -72,12 +75,15 @@ class Cache(HealthCheck):
         cache_key = f"{self.key_prefix}:{uuid.uuid4().hex}"
         cache_value = f"itworks-{datetime.datetime.now().timestamp()}"
         try:
-            await cache.aset(
-                cache_key,
-                cache_value,
-                timeout=self.timeout.total_seconds(),
-            )
-            if not await cache.aget(cache_key) == cache_value:
+            with self.phase("set"):
+                await cache.aset(
+                    cache_key,
+                    cache_value,
+                    timeout=self.timeout.total_seconds(),
+                )
+            with self.phase("get"):
+                value = await cache.aget(cache_key)
+            if not value == cache_value:
                 raise ServiceUnavailable(f"Cache key {cache_key} does not match")
         except CacheKeyWarning as e:
             raise ServiceReturnedUnexpectedResult("Cache key warning") from e
@@ -154,6 +160,8 @@ class DNS(HealthCheck):
     )
     nameservers: list[str] | None = dataclasses.field(default=None, repr=False)
 
+    node_local = True
+
     async def run(self):
         logger.debug("Attempting to resolve hostname: %s", self.hostname)
 
@@ -191,6 +199,58 @@ class DNS(HealthCheck):
             )
 
 
+@dataclasses.dataclass
+class EventLoopLag(HealthCheck):
+    """
+    Warn about a blocked event loop by measuring its scheduling delay.
+
+    Callbacks are scheduled on the running loop and the delay between their
+    scheduled and actual execution is measured. The maximum delay of all samples
+    is recorded in the `django_health_check_event_loop_lag_seconds` histogram.
+
+    The check is only meaningful with a long-living event loop, e.g. an ASGI server,
+    since WSGI servers run each request in a new event loop.
+
+    Args:
+        max_lag: Scheduling delay above which a warning is raised.
+        samples: Number of callbacks to schedule one after another.
+        interval: Time between a callback being scheduled and its scheduled execution.
+
+    """
+
+    max_lag: datetime.timedelta = dataclasses.field(
+        default=datetime.timedelta(milliseconds=100), repr=False
+    )
+    samples: int = dataclasses.field(default=5, repr=False)
+    interval: datetime.timedelta = dataclasses.field(
+        default=datetime.timedelta(milliseconds=10), repr=False
+    )
+
+    node_local = True
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        lag = 0.0
+        for _ in range(self.samples):
+            lag = max(lag, await self.get_lag(loop))
+        metrics.event_loop_lag.observe(tuple(self.labels.items()), lag)
+        if lag > self.max_lag.total_seconds():
+            raise ServiceWarning(f"Event loop lag {lag * 1000:.0f}\u202fms")
+
+    async def get_lag(self, loop: asyncio.AbstractEventLoop) -> float:
+        """Return the delay of a single callback scheduled on the given loop in seconds."""
+        future = loop.create_future()
+        scheduled_at = loop.time() + self.interval.total_seconds()
+
+        def set_lag():
+            # The future is cancelled if the check timed out.
+            if not future.done():
+                future.set_result(loop.time() - scheduled_at)
+
+        loop.call_at(scheduled_at, set_lag)
+        return max(0.0, await future)
+
+
 @dataclasses.dataclass
 class Mail(HealthCheck):
     """
@@ -212,7 +272,9 @@ class Mail(HealthCheck):
         connection.timeout = self.timeout.total_seconds()
         logger.debug("Trying to open connection to mail backend.")
         try:
-            connection.open()
+            # Opening the connection includes resolving the server's host.
+            with self.phase("open"):
+                connection.open()
         except smtplib.SMTPException as e:
             raise ServiceUnavailable(
                 "Failed to open connection with SMTP server"
@@ -220,7 +282,8 @@ class Mail(HealthCheck):
         except ConnectionRefusedError as e:
             raise ServiceUnavailable("Connection refused error") from e
         finally:
-            connection.close()
+            with self.phase("close"):
+                connection.close()
         logger.debug(
             "Connection established. Mail backend %r is healthy.", self.backend
         )
@@ -255,19 +318,26 @@ class Storage(HealthCheck):
 
     def check_save(self, file_name, file_content):
         # save the file
-        file_name = self.storage.save(file_name, ContentFile(content=file_content))
+        with self.phase("save"):
+            file_name = self.storage.save(file_name, ContentFile(content=file_content))
         # read the file and compare
-        if not self.storage.exists(file_name):
+        with self.phase("exists"):
+            exists = self.storage.exists(file_name)
+        if not exists:
             raise ServiceUnavailable("File does not exist")
-        with self.storage.open(file_name) as f:
-            if not f.read() == file_content:
-                raise ServiceUnavailable("File content does not match")
+        with self.phase("read"), self.storage.open(file_name) as f:
+            content = f.read()
+        if not content == file_content:
+            raise ServiceUnavailable("File content does not match")
         return file_name
 
     def check_delete(self, file_name):
         # delete the file and make sure it is gone
-        self.storage.delete(file_name)
-        if self.storage.exists(file_name):
+        with self.phase("delete"):
+            self.storage.delete(file_name)
+        with self.phase("exists"):
+            exists = self.storage.exists(file_name)
+        if exists:
             raise ServiceUnavailable("File was not deleted")
 
     def run(self):
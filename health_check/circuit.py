@@ -0,0 +1,109 @@
+"""Circuit breakers to stop probing failing services."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import time
+import typing
+
+from health_check.base import HealthCheck, HealthCheckResult
+from health_check.exceptions import CircuitOpen, HealthCheckException, ServiceWarning
+
+RunCheck = typing.Callable[[], typing.Awaitable[HealthCheckResult]]
+
+
+class CircuitState(enum.Enum):
+    """State of a check's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclasses.dataclass
+class Circuit:
+    """Failure history of a single check."""
+
+    failures: int = 0
+    last_error: HealthCheckException | None = None
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+@dataclasses.dataclass
+class CircuitBreaker:
+    """
+    Stop running checks after consecutive failures.
+
+    After `failure_threshold` consecutive failures, a check isn't run anymore
+    and reports its last error until the `cooldown` expired.
+    Thereafter, a single run of the check is let through.
+    If it succeeds, the check is run again as usual,
+    otherwise it isn't run for another `cooldown`.
+
+    Warnings don't count as failures, since the service is still operational.
+    Checks with the same representation share a circuit.
+
+    Args:
+        failure_threshold: Number of consecutive failures to stop running a check.
+        cooldown: Time a check isn't run after it failed too often.
+
+    """
+
+    failure_threshold: int = 3
+    cooldown: datetime.timedelta = datetime.timedelta(seconds=30)
+    circuits: dict[str, Circuit] = dataclasses.field(default_factory=dict, repr=False)
+
+    def get_state(self, check: HealthCheck) -> CircuitState:
+        """Return the state of the given check's circuit."""
+        match self.circuits.get(repr(check)):
+            case None:
+                return CircuitState.CLOSED
+            case Circuit(probing=True):
+                return CircuitState.HALF_OPEN
+            case Circuit(failures=failures) if failures < self.failure_threshold:
+                return CircuitState.CLOSED
+            case Circuit(opened_at=opened_at) if (
+                time.monotonic() - opened_at < self.cooldown.total_seconds()
+            ):
+                return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    async def get_result(self, check: HealthCheck, run: RunCheck) -> HealthCheckResult:
+        """Run the check unless its circuit is open and return its result."""
+        state = self.get_state(check)
+        circuit = self.circuits.setdefault(repr(check), Circuit())
+        match state:
+            case CircuitState.OPEN:
+                return self._short_circuit(check, circuit)
+            case CircuitState.HALF_OPEN if circuit.probing:
+                return self._short_circuit(check, circuit)
+        circuit.probing = state is CircuitState.HALF_OPEN
+        try:
+            result = await run()
+        finally:
+            circuit.probing = False
+        self._record(circuit, result)
+        return result
+
+    def _record(self, circuit: Circuit, result: HealthCheckResult) -> None:
+        match result.error:
+            case None | ServiceWarning():
+                circuit.failures = 0
+            case HealthCheckException():
+                circuit.failures += 1
+                circuit.last_error = result.error
+                if circuit.failures >= self.failure_threshold:
+                    circuit.opened_at = time.monotonic()
+
+    @staticmethod
+    def _short_circuit(check: HealthCheck, circuit: Circuit) -> HealthCheckResult:
+        return HealthCheckResult(
+            check=check,
+            error=CircuitOpen(
+                str(circuit.last_error), timestamp=circuit.last_error.timestamp
+            ),
+            time_taken=0.0,
+        )
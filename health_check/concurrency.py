@@ -0,0 +1,72 @@
+"""Limits for the number of checks running at once."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import timeit
+import typing
+import weakref
+
+from health_check.base import HealthCheck, HealthCheckResult
+
+RunCheck = typing.Callable[..., typing.Awaitable[HealthCheckResult]]
+
+
+@dataclasses.dataclass
+class ConcurrencyLimit:
+    """
+    Maximum number of checks running at once.
+
+    Checks exceeding the limit are queued until another check finished.
+    Checks may further limit the number of their own concurrent runs
+    via their `max_concurrency` attribute.
+
+    Share the same instance between views to limit the checks
+    across all requests served by the event loop.
+    Each event loop has its own slots, so under WSGI, where each request
+    runs in a new event loop, the limit only applies within a single request.
+
+    Args:
+        max_concurrency: Maximum number of checks running at once.
+
+    """
+
+    max_concurrency: int = 10
+    semaphores: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop,
+        dict[type[HealthCheck] | None, asyncio.Semaphore],
+    ] = dataclasses.field(default_factory=weakref.WeakKeyDictionary, repr=False)
+
+    async def get_result(self, check: HealthCheck, run: RunCheck) -> HealthCheckResult:
+        """
+        Run the check once a slot is available and record the time it was queued.
+
+        Args:
+            check: The check to run.
+            run: Function running the check, called with the time queued
+                as `queued_seconds`, e.g. the check's `get_result` method.
+
+        """
+        start = timeit.default_timer()
+        async with contextlib.AsyncExitStack() as stack:
+            if check.max_concurrency is not None:
+                await stack.enter_async_context(
+                    self.get_semaphore(type(check), check.max_concurrency)
+                )
+            await stack.enter_async_context(
+                self.get_semaphore(None, self.max_concurrency)
+            )
+            return await run(queued_seconds=timeit.default_timer() - start)
+
+    def get_semaphore(
+        self, check_type: type[HealthCheck] | None, value: int
+    ) -> asyncio.Semaphore:
+        """Return the running loop's semaphore for a check type or all checks."""
+        semaphores = self.semaphores.setdefault(asyncio.get_running_loop(), {})
+        try:
+            return semaphores[check_type]
+        except KeyError:
+            semaphore = semaphores[check_type] = asyncio.Semaphore(value)
+            return semaphore
@@ -29,6 +29,8 @@ class Battery(HealthCheck):
     power_plugged: bool = dataclasses.field(default=False, repr=False)
     hostname: str = dataclasses.field(default_factory=socket.gethostname, init=False)
 
+    node_local = True
+
     def run(self):
         try:
             battery = psutil.sensors_battery()
@@ -68,6 +70,8 @@ class CPU(HealthCheck):
     interval: datetime.timedelta | None = dataclasses.field(default=None, repr=False)
     hostname: str = dataclasses.field(default_factory=socket.gethostname, init=False)
 
+    node_local = True
+
     def run(self):
         try:
             usage_percent = psutil.cpu_percent(
@@ -98,6 +102,8 @@ class Disk(HealthCheck):
     max_disk_usage_percent: float | None = dataclasses.field(default=90.0, repr=False)
     hostname: str = dataclasses.field(default_factory=socket.gethostname, init=False)
 
+    node_local = True
+
     def run(self):
         try:
             du = psutil.disk_usage(str(self.path))
@@ -125,6 +131,8 @@ class Memory(HealthCheck):
     max_memory_usage_percent: float | None = dataclasses.field(default=90.0, repr=False)
     hostname: str = dataclasses.field(default_factory=socket.gethostname, init=False)
 
+    node_local = True
+
     def run(self):
         try:
             memory = psutil.virtual_memory()
@@ -162,6 +170,8 @@ class Temperature(HealthCheck):
     max_temperature_celsius: float | None = dataclasses.field(default=None, repr=False)
     hostname: str = dataclasses.field(default_factory=socket.gethostname, init=False)
 
+    node_local = True
+
     def run(self):
         try:
             temperatures = psutil.sensors_temperatures()
@@ -1,6 +1,7 @@
 """Redis health check."""
 
 import dataclasses
+import functools
 import logging
 import typing
 import warnings
@@ -54,6 +55,10 @@ class Redis(HealthCheck):
     )
 
     def __repr__(self):
+        return self._repr
+
+    @functools.cached_property
+    def _repr(self):
         # include client host name and logical database number to identify them
         if self.client_factory is not None:
             client = self.client_factory()
@@ -22,6 +22,18 @@ class ServiceUnavailable(HealthCheckException):
     message_type = "Unavailable"
 
 
+class CircuitOpen(ServiceUnavailable):
+    """Last error of a check that isn't run until its circuit breaker's cooldown expired."""
+
+    message_type = "Circuit open"
+
+
+class CheckSkipped(HealthCheckException):
+    """Check that was cancelled, since a critical check already failed."""
+
+    message_type = "Skipped"
+
+
 class ServiceReturnedUnexpectedResult(HealthCheckException):
     message_type = "Unexpected Result"
 
@@ -0,0 +1,77 @@
+"""Thread pools dedicated to synchronous health checks."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutorStats:
+    """Point-in-time utilization of an executor."""
+
+    max_workers: int
+    queued: int
+    running: int
+
+
+class HealthCheckExecutor(ThreadPoolExecutor):
+    """
+    Bounded thread pool that keeps track of its queue depth.
+
+    Synchronous checks running in a dedicated pool don't compete with the
+    application's own work in the event loop's default executor.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        super().__init__(max_workers, thread_name_prefix="health_check")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._lock:
+            self._queued += 1
+        try:
+            future = super().submit(self._track, fn, *args, **kwargs)
+        except BaseException:
+            self._dequeue()
+            raise
+        future.add_done_callback(self._dequeue_cancelled)
+        return future
+
+    @property
+    def stats(self) -> ExecutorStats:
+        """Return the number of queued and running calls."""
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self._max_workers,
+                queued=self._queued,
+                running=self._running,
+            )
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self._queued -= 1
+
+    def _dequeue_cancelled(self, future: Future) -> None:
+        if future.cancelled():
+            self._dequeue()
+
+    def _track(self, fn, /, *args, **kwargs):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+@functools.cache
+def get_shared_executor(max_workers: int | None) -> HealthCheckExecutor:
+    """Return the process-wide executor with the given or the default number of workers."""
+    return HealthCheckExecutor(max_workers)
@@ -0,0 +1,176 @@
+"""Health check results shared across processes via Django's cache framework."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import datetime
+import hashlib
+import json
+import logging
+import time
+import typing
+
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from health_check.base import HealthCheck, HealthCheckResult
+from health_check.exceptions import HealthCheckException
+
+logger = logging.getLogger(__name__)
+
+RunChecks = typing.Callable[
+    [typing.Sequence[HealthCheck]], typing.Awaitable[list[HealthCheckResult]]
+]
+
+
+class Serializer(typing.Protocol):
+    def dumps(self, obj: typing.Any) -> str | bytes: ...
+
+    def loads(self, s: str | bytes) -> typing.Any: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class FleetCache:
+    """
+    Results shared by all processes using the same cache.
+
+    A single process acquires a lease, runs the checks and stores their results.
+    All other processes read the stored results until they are older than `max_age`.
+    While the results are refreshed, other processes keep reading the previous results.
+
+    Node-local checks, like [psutil][health_check.contrib.psutil] or
+    [DNS][health_check.checks.DNS] checks, are always run by each process.
+
+    Args:
+        alias: The cache alias to share results with.
+        max_age: Time after which results are refreshed.
+        lease: Time a process may take to refresh the results before another process takes over.
+        serializer: Object with `dumps` and `loads` functions to store results, e.g. `json` or `pickle`.
+        key_prefix: Prefix for the cache keys.
+
+    """
+
+    alias: str = "default"
+    max_age: datetime.timedelta = datetime.timedelta(seconds=10)
+    lease: datetime.timedelta = datetime.timedelta(seconds=10)
+    serializer: Serializer = dataclasses.field(default=json, repr=False)
+    key_prefix: str = "djangohealthcheck_fleet"
+
+    async def get_results(
+        self, checks: typing.Sequence[HealthCheck], run_checks: RunChecks
+    ) -> list[HealthCheckResult]:
+        """Return results of shared checks from the cache and run node-local checks."""
+        shared_results, local_results = await asyncio.gather(
+            self.get_shared_results(
+                [check for check in checks if not check.node_local], run_checks
+            ),
+            run_checks([check for check in checks if check.node_local]),
+        )
+        results = {id(result.check): result for result in shared_results}
+        results |= {id(result.check): result for result in local_results}
+        return [results[id(check)] for check in checks]
+
+    async def get_shared_results(
+        self, checks: typing.Sequence[HealthCheck], run_checks: RunChecks
+    ) -> list[HealthCheckResult]:
+        """Return stored results or run the checks if the lease can be acquired."""
+        if not checks:
+            return []
+        try:
+            return await self._get_shared_results(checks, run_checks)
+        except Exception:
+            logger.warning("Failed to share health check results", exc_info=True)
+            return await run_checks(checks)
+
+    def get_key(self, checks: typing.Sequence[HealthCheck]) -> str:
+        """Return a cache key identifying the given checks across processes."""
+        digest = hashlib.sha256(
+            "\n".join(repr(check) for check in checks).encode()
+        ).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    async def _get_shared_results(
+        self, checks: typing.Sequence[HealthCheck], run_checks: RunChecks
+    ) -> list[HealthCheckResult]:
+        cache = caches[self.alias]
+        key = self.get_key(checks)
+        match payload := await cache.aget(key):
+            case str() | bytes() if (
+                time.time() - (data := self.serializer.loads(payload))["created_at"]
+                < self.max_age.total_seconds()
+            ):
+                return self.load_results(data, checks)
+        if await cache.aadd(f"{key}:lease", True, self.lease.total_seconds()):
+            results = await run_checks(checks)
+            await cache.aset(
+                key,
+                self.serializer.dumps(self.dump_results(results)),
+                (self.max_age + self.lease).total_seconds(),
+            )
+            await cache.adelete(f"{key}:lease")
+            return results
+        if payload is None:
+            return await run_checks(checks)
+        return self.load_results(self.serializer.loads(payload), checks)
+
+    @staticmethod
+    def dump_results(results: typing.Sequence[HealthCheckResult]) -> dict:
+        """Return results as primitive types."""
+        return {
+            "created_at": time.time(),
+            "results": [
+                {
+                    "time_taken": result.time_taken,
+                    "queued_seconds": result.queued_seconds,
+                    "run_seconds": result.run_seconds,
+                    "cpu_seconds": result.cpu_seconds,
+                    "phases": result.phases,
+                    "error": None
+                    if result.error is None
+                    else {
+                        "type": f"{type(result.error).__module__}.{type(result.error).__qualname__}",
+                        "message": result.error.message,
+                        "timestamp": result.error.timestamp.isoformat(),
+                    },
+                }
+                for result in results
+            ],
+        }
+
+    @classmethod
+    def load_results(
+        cls, data: dict, checks: typing.Sequence[HealthCheck]
+    ) -> list[HealthCheckResult]:
+        """Return results from primitive types for the given checks."""
+        return [
+            HealthCheckResult(
+                check=check,
+                error=None
+                if result["error"] is None
+                else cls.load_error(result["error"]),
+                time_taken=result["time_taken"],
+                queued_seconds=result.get("queued_seconds", 0.0),
+                run_seconds=result.get("run_seconds", 0.0),
+                cpu_seconds=result.get("cpu_seconds"),
+                phases=result.get("phases", {}),
+            )
+            for check, result in zip(checks, data["results"], strict=True)
+        ]
+
+    @staticmethod
+    def load_error(data: dict) -> HealthCheckException:
+        """Return an exception from primitive types."""
+        try:
+            error_class = import_string(data["type"])
+        except ImportError:
+            error_class = HealthCheckException
+        if not (
+            isinstance(error_class, type)
+            and issubclass(error_class, HealthCheckException)
+        ):
+            error_class = HealthCheckException
+        return error_class(
+            data["message"],
+            timestamp=datetime.datetime.fromisoformat(data["timestamp"]),
+        )
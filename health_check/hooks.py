@@ -0,0 +1,107 @@
+"""
+Signals sent before and after each health check run.
+
+Receivers are called in a background thread, so that slow receivers,
+e.g. sending metrics to StatsD, never delay the health checks.
+The check's `labels` are passed as a read-only mapping.
+
+Examples:
+    >>> from django.dispatch import receiver
+    >>> from health_check.hooks import check_finished
+    >>>
+    >>> @receiver(check_finished)
+    ... def send_timing(sender, check, labels, started_at, result, error, **kwargs):
+    ...     statsd.timing(f"health_check.{labels['check']}", result.time_taken * 1000)
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import queue
+import threading
+import types
+import typing
+
+from django.dispatch import Signal
+
+if typing.TYPE_CHECKING:
+    from health_check.base import HealthCheck
+
+logger = logging.getLogger(__name__)
+
+#: Sent before a check is run with the `check`, its `labels` and the `started_at` time.
+check_started = Signal()
+
+#: Sent after a check was run with the `check`, its `labels`, the `started_at` time,
+#: its `result` and its `error`, if any.
+check_finished = Signal()
+
+
+@dataclasses.dataclass
+class HookDispatcher:
+    """
+    Bounded queue of signals that are sent in a background thread.
+
+    Signals without receivers are not queued at all. If the receivers can't keep up,
+    signals exceeding the queue's size are dropped and counted.
+
+    Args:
+        maxsize: Number of signals that may be pending before further signals are dropped.
+
+    """
+
+    maxsize: int = 1000
+    dropped: int = dataclasses.field(default=0, init=False)
+    queue: queue.Queue = dataclasses.field(init=False, repr=False)
+    lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    thread: threading.Thread | None = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self.queue = queue.Queue(self.maxsize)
+
+    def send(self, signal: Signal, check: HealthCheck, **kwargs: typing.Any) -> None:
+        """Queue the signal for the given check without waiting for its receivers."""
+        if not signal.has_listeners(type(check)):
+            return
+        self.start()
+        try:
+            self.queue.put_nowait((signal, check, kwargs))
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+    def start(self) -> None:
+        """Start the background thread unless it's running, e.g. after a fork."""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self._work, name="health_check_hooks", daemon=True
+                )
+                self.thread.start()
+
+    def _work(self) -> typing.NoReturn:
+        while True:
+            signal, check, kwargs = self.queue.get()
+            try:
+                # The labels are shared with the metrics and must not be changed.
+                signal.send_robust(
+                    sender=type(check),
+                    check=check,
+                    labels=types.MappingProxyType(check.labels),
+                    **kwargs,
+                )
+            except Exception:
+                logger.exception("Failed to send health check signal")
+            finally:
+                self.queue.task_done()
+
+
+dispatcher = HookDispatcher()
@@ -8,6 +8,9 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.urls import NoReverseMatch, resolve, reverse
 
+from health_check import tracing
+from health_check.profiling import trace_allocations
+
 
 class Command(BaseCommand):
     help = "Run health checks and exit 0 if everything went well."
@@ -70,6 +73,11 @@ class Command(BaseCommand):
             dest="use_http",
             help="Run checks directly without HTTP server",
         )
+        parser.add_argument(
+            "--trace-allocations",
+            action="store_true",
+            help="Run checks directly and report the memory allocated by each check",
+        )
 
     def handle(self, *args, **options):
         endpoint = options.get("endpoint")
@@ -82,6 +90,9 @@ class Command(BaseCommand):
             )
             sys.exit(2)
 
+        if options.get("trace_allocations"):
+            asyncio.run(self._trace_allocations(path))
+
         if not options.get("use_http"):
             asyncio.run(self._run_checks_directly(path))
 
@@ -142,13 +153,15 @@ class Command(BaseCommand):
         else:
             self.stdout.write(response.read().decode("utf-8"))
 
+    def _get_view(self, path):
+        resolver_match = resolve(path)
+        return resolver_match.func.view_class(**resolver_match.func.view_initkwargs)
+
     async def _run_checks_directly(self, path):
         """Run health checks directly without HTTP server."""
-        resolver_match = resolve(path)
-        view = resolver_match.func.view_class(**resolver_match.func.view_initkwargs)
-        results = await asyncio.gather(
-            *(check.get_result() for check in view.get_checks())
-        )
+        view = self._get_view(path)
+        with tracing.start_as_current_span(f"health_check {path}"):
+            results = await view.gather_results(view.get_checks())
         error = False
         for result in results:
             self.stdout.write(
@@ -156,3 +169,22 @@ class Command(BaseCommand):
             )
             error |= bool(result.error)
         sys.exit(int(error))
+
+    async def _trace_allocations(self, path):
+        """Run health checks directly and report their memory allocations."""
+        view = self._get_view(path)
+        error = False
+        for allocations in await trace_allocations(
+            view.get_checks(), timeout=view.check_timeout
+        ):
+            result = allocations.result
+            self.stdout.write(
+                f"{result.check!r}: {'OK' if not result.error else result.error!s}\n"
+                f"  net: {allocations.net_bytes} B, peak: {allocations.peak_bytes} B"
+            )
+            for site in allocations.sites:
+                self.stdout.write(
+                    f"  {site.size:>10} B {site.count:>6}x  {site.file}:{site.line}"
+                )
+            error |= bool(result.error)
+        sys.exit(int(error))
@@ -0,0 +1,68 @@
+"""Process-local metrics of health check runs."""
+
+from __future__ import annotations
+
+import array
+import bisect
+import dataclasses
+import itertools
+import threading
+import typing
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Distribution of observed values across fixed buckets."""
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # The last count is the overflow bucket for values above all bounds.
+        self.counts = array.array("Q", itertools.repeat(0, len(self.buckets) + 1))
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the first bucket whose upper bound is not below it."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        """Return the number of observed values."""
+        return sum(self.counts)
+
+    def cumulative_counts(self) -> typing.Iterator[tuple[float, int]]:
+        """Yield each upper bound with the number of values less than or equal to it."""
+        return zip((*self.buckets, float("inf")), itertools.accumulate(self.counts))
+
+
+@dataclasses.dataclass
+class HistogramFamily:
+    """Histograms of the same metric, one per set of check labels."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    histograms: dict[typing.Hashable, Histogram] = dataclasses.field(
+        default_factory=dict, repr=False
+    )
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False)
+
+    def observe(self, key: typing.Hashable, value: float) -> None:
+        """Add a value to the histogram of the given key."""
+        with self.lock:
+            try:
+                histogram = self.histograms[key]
+            except KeyError:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def get(self, key: typing.Hashable) -> Histogram | None:
+        """Return the histogram of the given key, if any values were observed."""
+        return self.histograms.get(key)
+
+
+response_time = HistogramFamily()
+event_loop_lag = HistogramFamily(
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
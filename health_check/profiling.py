@@ -0,0 +1,244 @@
+"""On-demand profiling and allocation tracing of health checks."""
+
+from __future__ import annotations
+
+import cProfile
+import dataclasses
+import datetime
+import pstats
+import sys
+import threading
+import tracemalloc
+import typing
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from health_check.base import HealthCheck, HealthCheckResult
+
+# Only a single profiler can be active in the event loop's thread at a time.
+_lock = threading.Lock()
+
+# Since Python 3.12, cProfile is based on `sys.monitoring`, which covers all threads
+# of the interpreter but only allows a single active profiler.
+_PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class ProfilerBusy(RuntimeError):
+    """Another profile is being recorded in this process."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Frame:
+    """Time spent in a function while the check was run."""
+
+    function: str
+    file: str
+    line: int
+    calls: int
+    total_time: float
+    cumulative_time: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Profile:
+    """Result of a check with the functions it spent the most time in."""
+
+    result: HealthCheckResult
+    frames: list[Frame]
+
+
+@dataclasses.dataclass(frozen=True)
+class AllocationSite:
+    """Memory allocated at a source line and not yet released after the check."""
+
+    file: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Allocations:
+    """Result of a check with the memory it allocated."""
+
+    result: HealthCheckResult
+    net_bytes: int
+    peak_bytes: int
+    sites: list[AllocationSite]
+
+
+class ProfilingExecutor(Executor):
+    """
+    Executor that profiles each call it runs in another executor.
+
+    Only needed before Python 3.12, since profilers used to cover a single thread.
+    """
+
+    def __init__(self, executor: Executor):
+        self.executor = executor
+        self.profilers: list[cProfile.Profile] = []
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self.executor.submit(self._profile, fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self.executor.shutdown(wait, cancel_futures=cancel_futures)
+
+    def _profile(self, fn, /, *args, **kwargs):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self.profilers.append(profiler)
+
+
+async def profile_checks(
+    checks: typing.Iterable[HealthCheck],
+    *,
+    timeout: datetime.timedelta | None = None,
+    limit: int = 10,
+) -> list[Profile]:
+    """
+    Run the checks one after another under `cProfile` and return their profiles.
+
+    Checks are run sequentially to attribute the time spent in the
+    event loop to a single check. Synchronous checks are run in a dedicated
+    thread, which is profiled as well.
+
+    Args:
+        checks: The checks to profile.
+        timeout: Time after which a check is considered unavailable or None to wait indefinitely.
+        limit: Number of functions with the most time spent in them to return per check.
+
+    Raises:
+        ProfilerBusy: If another profile is being recorded in this process.
+
+    """
+    if not _lock.acquire(blocking=False):
+        raise ProfilerBusy("Another profile is being recorded.")
+    thread_pool = ThreadPoolExecutor(1, thread_name_prefix="health_check_profile")
+    try:
+        return [
+            await profile_check(check, thread_pool, timeout=timeout, limit=limit)
+            for check in checks
+        ]
+    finally:
+        # Don't wait for timed-out checks that are still occupying the thread.
+        thread_pool.shutdown(wait=False)
+        _lock.release()
+
+
+async def profile_check(
+    check: HealthCheck,
+    executor: Executor,
+    *,
+    timeout: datetime.timedelta | None = None,
+    limit: int = 10,
+) -> Profile:
+    """Run a single check under `cProfile` and return its profile."""
+    if not _PROFILES_ALL_THREADS:
+        executor = ProfilingExecutor(executor)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = await check.get_result(executor, timeout)
+    finally:
+        profiler.disable()
+    stats = pstats.Stats(profiler)
+    if not _PROFILES_ALL_THREADS:
+        # Timed-out synchronous runs may still add their profiler later.
+        for thread_profiler in list(executor.profilers):
+            stats.add(thread_profiler)
+    return Profile(result=result, frames=get_frames(stats, limit))
+
+
+def get_frames(stats: pstats.Stats, limit: int) -> list[Frame]:
+    """Return the functions with the most time spent in them, excluding subcalls."""
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        Frame(
+            function=function,
+            file=file,
+            line=line,
+            calls=calls,
+            total_time=total_time,
+            cumulative_time=cumulative_time,
+        )
+        for (file, line, function), (_, calls, total_time, cumulative_time, _) in (
+            entries[:limit]
+        )
+    ]
+
+
+async def trace_allocations(
+    checks: typing.Iterable[HealthCheck],
+    *,
+    timeout: datetime.timedelta | None = None,
+    limit: int = 10,
+    frames: int = 1,
+) -> list[Allocations]:
+    """
+    Run the checks one after another under `tracemalloc` and return their allocations.
+
+    Each check is run once before it is traced, to exclude one-time allocations,
+    like imports or connection pools, from the allocations of a regular run.
+
+    Args:
+        checks: The checks to trace.
+        timeout: Time after which a check is considered unavailable or None to wait indefinitely.
+        limit: Number of source lines with the most memory allocated to return per check.
+        frames: Number of frames stored per allocation.
+
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(frames)
+    thread_pool = ThreadPoolExecutor(1, thread_name_prefix="health_check_tracemalloc")
+    try:
+        allocations = []
+        for check in checks:
+            await check.get_result(thread_pool, timeout)
+            allocations.append(
+                await trace_check(check, thread_pool, timeout=timeout, limit=limit)
+            )
+        return allocations
+    finally:
+        thread_pool.shutdown(wait=False)
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+async def trace_check(
+    check: HealthCheck,
+    executor: Executor,
+    *,
+    timeout: datetime.timedelta | None = None,
+    limit: int = 10,
+) -> Allocations:
+    """Run a single check while `tracemalloc` is tracing and return its allocations."""
+    # Exclude tracemalloc's own allocations, e.g. of the snapshots.
+    filters = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    before = tracemalloc.take_snapshot().filter_traces(filters)
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = await check.get_result(executor, timeout)
+    _, peak = tracemalloc.get_traced_memory()
+    statistics = (
+        tracemalloc.take_snapshot().filter_traces(filters).compare_to(before, "lineno")
+    )
+    return Allocations(
+        result=result,
+        net_bytes=sum(statistic.size_diff for statistic in statistics),
+        peak_bytes=peak - baseline,
+        sites=[
+            AllocationSite(
+                file=statistic.traceback[0].filename,
+                line=statistic.traceback[0].lineno,
+                size=statistic.size_diff,
+                count=statistic.count_diff,
+            )
+            for statistic in statistics
+            if statistic.size_diff > 0
+        ][:limit],
+    )
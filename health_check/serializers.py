@@ -0,0 +1,19 @@
+"""JSON serialization of health check reports, using orjson if installed."""
+
+from __future__ import annotations
+
+import json
+import typing
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    # The standard library is used if orjson isn't installed.
+    orjson = None
+
+
+def dumps(data: typing.Any) -> bytes:
+    """Return the data as compact JSON, serialized with orjson if it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
@@ -0,0 +1,227 @@
+"""Process-local snapshots of health check results."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import datetime
+import functools
+import hashlib
+import time
+import timeit
+import typing
+import weakref
+
+from health_check.base import HealthCheck, HealthCheckResult
+from health_check.exceptions import ServiceUnavailable
+
+RunChecks = typing.Callable[[], typing.Awaitable[list[HealthCheckResult]]]
+RunCheck = typing.Callable[[HealthCheck], typing.Awaitable[HealthCheckResult]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+    """
+    Latest results of all checks of a view.
+
+    Responses rendered from the results can be stored in `rendered`,
+    to serve them again without rendering until the results change.
+    """
+
+    results: list[HealthCheckResult]
+    created_at: float = dataclasses.field(default_factory=time.monotonic)
+    rendered: dict[str, bytes] = dataclasses.field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @property
+    def age(self) -> datetime.timedelta:
+        """Return the time passed since the checks have been run."""
+        return datetime.timedelta(seconds=time.monotonic() - self.created_at)
+
+    @functools.cached_property
+    def digest(self) -> str:
+        """Return a digest of the results, computed once per snapshot."""
+        return get_digest(self.results)
+
+
+def get_digest(results: typing.Iterable[HealthCheckResult]) -> str:
+    """Return a digest of the status and error message of each check, excluding timings."""
+    digest = hashlib.md5(usedforsecurity=False)
+    for result in results:
+        digest.update(f"{result.check!r}\0{result.error or ''}\0".encode())
+    return digest.hexdigest()
+
+
+@dataclasses.dataclass
+class SnapshotCache:
+    """
+    Latest snapshot of a view configuration with stale-while-revalidate semantics.
+
+    Snapshots younger than `max_age` are served as they are.
+    Snapshots within the following `stale_while_revalidate` window are served
+    immediately, while the checks are run again in the background.
+    Older snapshots are replaced before they are served.
+
+    Concurrent callers share a single pending run of the checks
+    instead of each starting their own.
+
+    Alternatively, the checks can be scheduled to run in the background
+    at their refresh interval, while callers only read the latest snapshot.
+
+    Subscribers receive each new snapshot, e.g. to push results to clients.
+    """
+
+    snapshot: Snapshot | None = None
+    refresh_task: asyncio.Task | None = dataclasses.field(default=None, repr=False)
+    scheduled_tasks: list[asyncio.Task] = dataclasses.field(
+        default_factory=list, repr=False
+    )
+    subscribers: weakref.WeakSet[asyncio.Queue[Snapshot]] = dataclasses.field(
+        default_factory=weakref.WeakSet, repr=False
+    )
+
+    async def get(
+        self,
+        run_checks: RunChecks,
+        *,
+        max_age: datetime.timedelta,
+        stale_while_revalidate: datetime.timedelta,
+    ) -> Snapshot:
+        """Return a snapshot no older than the given bounds."""
+        match self.snapshot:
+            case Snapshot(age=age) if age < max_age:
+                return self.snapshot
+            case Snapshot(age=age) if age < max_age + stale_while_revalidate:
+                self.revalidate(run_checks)
+                return self.snapshot
+        return await self.refresh(run_checks)
+
+    def revalidate(self, run_checks: RunChecks) -> asyncio.Task[Snapshot]:
+        """Return the pending run of the checks or start a new one in the background."""
+        match self.refresh_task:
+            case asyncio.Task() if (
+                not self.refresh_task.done()
+                and self.refresh_task.get_loop() is asyncio.get_running_loop()
+            ):
+                return self.refresh_task
+        self.refresh_task = asyncio.create_task(self._refresh(run_checks))
+        return self.refresh_task
+
+    async def refresh(self, run_checks: RunChecks) -> Snapshot:
+        """Return a new snapshot, joining a pending run of the checks if any."""
+        return await asyncio.shield(self.revalidate(run_checks))
+
+    async def _refresh(self, run_checks: RunChecks) -> Snapshot:
+        self.publish(Snapshot(results=await run_checks()))
+        return self.snapshot
+
+    def subscribe(self) -> asyncio.Queue[Snapshot]:
+        """
+        Return a queue that receives each new snapshot until it's unsubscribed.
+
+        The queue only holds the latest snapshot, so that slow subscribers
+        skip outdated snapshots instead of falling behind.
+        Queues that are no longer referenced are unsubscribed automatically.
+        """
+        queue = asyncio.Queue(maxsize=1)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[Snapshot]) -> None:
+        """Stop sending new snapshots to the given queue."""
+        self.subscribers.discard(queue)
+
+    def publish(self, snapshot: Snapshot) -> None:
+        """Replace the latest snapshot and send it to all subscribers."""
+        self.snapshot = snapshot
+        for queue in self.subscribers:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
+    async def get_scheduled(
+        self,
+        run_checks: RunChecks,
+        run_check: RunCheck,
+        *,
+        refresh_interval: datetime.timedelta,
+    ) -> Snapshot:
+        """
+        Return the latest snapshot and schedule the checks on the first call.
+
+        Each check is run again after its own `refresh_interval`,
+        or the given `refresh_interval` if the check doesn't define one.
+        Checks still running after twice their interval are reported
+        as unavailable until their run finished, instead of serving
+        their previous result indefinitely.
+        """
+        if not self.is_scheduled:
+            await self.refresh(run_checks)
+        if not self.is_scheduled:
+            self.unschedule()
+            self.scheduled_tasks = [
+                asyncio.create_task(
+                    self._repeat(
+                        index,
+                        result.check,
+                        run_check,
+                        result.check.refresh_interval or refresh_interval,
+                    )
+                )
+                for index, result in enumerate(self.snapshot.results)
+            ]
+        return self.snapshot
+
+    def unschedule(self) -> None:
+        """Stop running the checks in the background."""
+        for task in self.scheduled_tasks:
+            loop = task.get_loop()
+            if loop is asyncio.get_running_loop():
+                task.cancel()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(task.cancel)
+        self.scheduled_tasks = []
+
+    @property
+    def is_scheduled(self) -> bool:
+        """Return whether the checks are run in the background on the current loop."""
+        loop = asyncio.get_running_loop()
+        return bool(self.scheduled_tasks) and all(
+            not task.done() and task.get_loop() is loop for task in self.scheduled_tasks
+        )
+
+    async def _repeat(
+        self,
+        index: int,
+        check: HealthCheck,
+        run_check: RunCheck,
+        refresh_interval: datetime.timedelta,
+    ) -> typing.NoReturn:
+        while True:
+            await asyncio.sleep(refresh_interval.total_seconds())
+            start = timeit.default_timer()
+            run = asyncio.ensure_future(run_check(check))
+            try:
+                done, _ = await asyncio.wait(
+                    {run}, timeout=2 * refresh_interval.total_seconds()
+                )
+                if not done:
+                    self._replace(
+                        index,
+                        HealthCheckResult(
+                            check=check,
+                            error=ServiceUnavailable("stale"),
+                            time_taken=timeit.default_timer() - start,
+                        ),
+                    )
+                self._replace(index, await run)
+            finally:
+                run.cancel()
+
+    def _replace(self, index: int, result: HealthCheckResult) -> None:
+        results = self.snapshot.results
+        self.publish(
+            Snapshot(results=[*results[:index], result, *results[index + 1 :]])
+        )
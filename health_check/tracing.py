@@ -0,0 +1,47 @@
+"""OpenTelemetry spans for health check runs, if OpenTelemetry is installed."""
+
+from __future__ import annotations
+
+import contextlib
+import typing
+
+from health_check.base import HealthCheck, HealthCheckResult
+
+try:
+    from opentelemetry import trace
+except ModuleNotFoundError:
+    # Tracing is disabled if OpenTelemetry isn't installed.
+    trace = None
+    tracer = None
+else:
+    tracer = trace.get_tracer(__name__)
+
+
+def start_as_current_span(name: str) -> contextlib.AbstractContextManager:
+    """Return a context manager for a span around multiple checks, if tracing is enabled."""
+    if tracer is None:
+        return contextlib.nullcontext()
+    return tracer.start_as_current_span(name)
+
+
+async def get_result(
+    check: HealthCheck,
+    run: typing.Callable[[], typing.Awaitable[HealthCheckResult]],
+) -> HealthCheckResult:
+    """
+    Run the check in a child span of the current span and return its result.
+
+    The span carries the check's labels as attributes
+    and records the check's error as an exception event.
+    """
+    labels = check.labels
+    with tracer.start_as_current_span(
+        f"health_check {labels['check']}",
+        attributes={f"health_check.{key}": value for key, value in labels.items()},
+    ) as span:
+        result = await run()
+        span.set_attribute("health_check.time_taken", result.time_taken)
+        if result.error is not None:
+            span.record_exception(result.error)
+            span.set_status(trace.StatusCode.ERROR, str(result.error))
+        return result
@@ -1,20 +1,114 @@
 import asyncio
 import contextlib
+import dataclasses
 import datetime
+import functools
+import hmac
+import json
 import re
+import timeit
 import typing
+import zlib
 from concurrent.futures import Executor
 
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from django.http import HttpResponse, JsonResponse
-from django.utils.cache import patch_vary_headers
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
 from django.utils.decorators import method_decorator
 from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
 from django.utils.module_loading import import_string
-from django.views.decorators.cache import never_cache
+from django.views.decorators.cache import cache_control
 from django.views.generic import TemplateView
 
-from health_check.base import HealthCheck
+from health_check import hooks, metrics, serializers, tracing
+from health_check.base import HealthCheck, HealthCheckResult
+from health_check.circuit import CircuitBreaker, CircuitState
+from health_check.concurrency import ConcurrencyLimit
+from health_check.exceptions import CheckSkipped, ServiceWarning
+from health_check.executor import get_shared_executor
+from health_check.fleet import FleetCache
+from health_check.profiling import ProfilerBusy, profile_checks
+from health_check.snapshot import Snapshot, SnapshotCache, get_digest
+
+CheckDefinition = (
+    type[HealthCheck] | str | tuple[type[HealthCheck] | str, dict[str, typing.Any]]
+)
+
+#: Type and help text of the OpenMetrics metric families.
+OPENMETRICS_METRICS = {
+    "django_health_check_status": (
+        "gauge",
+        "Health check status (1 = healthy, 0 = unhealthy)",
+    ),
+    "django_health_check_response_time_seconds": (
+        "gauge",
+        "Health check response time in seconds",
+    ),
+    "django_health_check_phase_seconds": (
+        "gauge",
+        "Health check phase response time in seconds",
+    ),
+    "django_health_check_latency_seconds": (
+        "histogram",
+        "Health check response time distribution in seconds",
+    ),
+    "django_health_check_event_loop_lag_seconds": (
+        "histogram",
+        "Event loop scheduling delay distribution in seconds",
+    ),
+    "django_health_check_hook_signals_dropped": (
+        "counter",
+        "Health check signals dropped because their receivers couldn't keep up",
+    ),
+    "django_health_check_cpu_seconds": (
+        "gauge",
+        "CPU time the health check used in seconds",
+    ),
+    "django_health_check_executor_max_workers": (
+        "gauge",
+        "Number of threads dedicated to synchronous health checks",
+    ),
+    "django_health_check_executor_queued": (
+        "gauge",
+        "Number of synchronous health checks waiting for a thread",
+    ),
+    "django_health_check_executor_running": (
+        "gauge",
+        "Number of synchronous health checks running in a thread",
+    ),
+    "django_health_check_queued_seconds": (
+        "gauge",
+        "Time the health check waited for a thread or the concurrency limit in seconds",
+    ),
+    "django_health_check_run_seconds": (
+        "gauge",
+        "Time the health check's run took in seconds",
+    ),
+    "django_health_check_skipped": (
+        "gauge",
+        "Health check skipped after a critical failure (1 = skipped, 0 = run)",
+    ),
+    "django_health_check_circuit": (
+        "stateset",
+        "Health check circuit breaker state",
+    ),
+    "django_health_check_overall_status": (
+        "gauge",
+        "Overall health check status (1 = all healthy, 0 = at least one unhealthy)",
+    ),
+}
+
+#: Statuses of the `application/health+json` format by increasing severity.
+_HEALTH_JSON_STATUSES = ("pass", "warn", "fail")
+
+# HELP and TYPE lines of each metric family, which are the same for every scrape.
+_OPENMETRICS_PREAMBLES = {
+    name: f"# HELP {name} {help_text}\n# TYPE {name} {metric_type}"
+    for name, (metric_type, help_text) in OPENMETRICS_METRICS.items()
+}
 
 
 class MediaType:
@@ -90,14 +184,69 @@ class MediaType:
 
 
 class HealthCheckView(TemplateView):
-    """Perform health checks and return results in various formats."""
+    """
+    Perform health checks and return results in various formats.
+
+    Attributes:
+        cache_timeout: Time results are served without running the checks again,
+            or None to run the checks on every request.
+        stale_while_revalidate: Time after the `cache_timeout` during which
+            outdated results are served while the checks run in the background.
+        check_timeout: Time after which a single check is considered unavailable,
+            or None to wait for each check indefinitely.
+        refresh_interval: Time between background runs of the checks,
+            or None to run the checks on request.
+            The background runs start with the first request and take precedence
+            over the `cache_timeout`. Checks may define their own `refresh_interval`.
+        executor_max_workers: Size of the process-wide thread pool dedicated to
+            synchronous checks, or None to use the event loop's default executor.
+        fleet_cache: Cache to share results with other processes,
+            or None to run the checks in each process.
+        circuit_breaker: Circuit breaker to stop running checks after consecutive
+            failures, or None to run failing checks on every request.
+        concurrency_limit: Limit for the number of checks running at once,
+            or None to run all checks at once.
+        fail_fast: Whether to skip all pending checks once a critical check failed.
+        cpu_time: Whether to measure the CPU time each check used besides its wall time.
+        json_timings: Whether JSON reports include the time taken, the time queued,
+            the run time, the CPU time and the phases of each check.
+        profiling: Whether checks can be profiled via the `profile` query parameter
+            by clients from Django's `INTERNAL_IPS` or with the `profile_secret`.
+        profile_secret: Secret that grants profiling via the `profile` query parameter
+            from any address, or None or empty to limit profiling to `INTERNAL_IPS`.
+        json_dumps: Function serializing `application/health+json` reports to bytes,
+            using orjson if it's installed.
+        max_event_streams: Number of clients that may receive the results of the
+            scheduled runs via Server-Sent Events at once, or 0 to disable event streams.
+            Event streams require a `refresh_interval`.
+        event_stream_heartbeat: Time without changes after which event streams send
+            a comment, to keep the connection open.
+
+    """
 
     template_name = "health_check/index.html"
     feed_author = "Django Health Check"
+    cache_timeout: datetime.timedelta | None = None
+    stale_while_revalidate: datetime.timedelta = datetime.timedelta(0)
+    check_timeout: datetime.timedelta | None = None
+    refresh_interval: datetime.timedelta | None = None
+    executor_max_workers: int | None = None
+    fleet_cache: FleetCache | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    concurrency_limit: ConcurrencyLimit | None = None
+    fail_fast: bool = False
+    cpu_time: bool = False
+    json_timings: bool = False
+    profiling: bool = False
+    profile_secret: str | None = None
+    json_dumps: typing.Callable[[typing.Any], bytes] = staticmethod(serializers.dumps)
+    max_event_streams: int = 0
+    event_stream_heartbeat: datetime.timedelta = datetime.timedelta(seconds=15)
+    compiled_checks: tuple[HealthCheck, ...] | None = None
+    openmetrics_labels: dict[int, str] | None = None
+    snapshot_cache: SnapshotCache | None = None
 
-    checks: typing.Iterable[
-        type[HealthCheck] | str | tuple[type[HealthCheck] | str, dict[str, typing.Any]]
-    ] = (
+    checks: typing.Iterable[CheckDefinition] = (
         "health_check.checks.Cache",
         "health_check.checks.Database",
         "health_check.checks.DNS",
@@ -105,21 +254,82 @@ class HealthCheckView(TemplateView):
         "health_check.checks.Storage",
     )
 
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Return a view function that shares its checks and results across requests.
+
+        The checks are imported and instantiated once, so that misconfigurations
+        raise errors when the URLconf is loaded rather than on the first request.
+        """
+        if initkwargs.get(
+            "max_event_streams", cls.max_event_streams
+        ) and not initkwargs.get("refresh_interval", cls.refresh_interval):
+            raise ImproperlyConfigured(
+                "Event streams require a refresh_interval to run the checks in the background."
+            )
+        compiled_checks = tuple(
+            cls.compile_checks(initkwargs.get("checks", cls.checks))
+        )
+        return super().as_view(
+            **{
+                "compiled_checks": compiled_checks,
+                # The compiled checks live as long as the view, so their ids are stable.
+                "openmetrics_labels": {
+                    id(check): cls.abnf_dumps(check.labels) for check in compiled_checks
+                },
+                "snapshot_cache": SnapshotCache(),
+                **initkwargs,
+            }
+        )
+
     @method_decorator(transaction.non_atomic_requests)
     async def dispatch(self, request, *args, **kwargs):
         response = await super().dispatch(request, *args, **kwargs)
         patch_vary_headers(response, ["Accept"])
         return response
 
-    @method_decorator(never_cache)
+    # Clients may store responses, but must revalidate them using their ETag.
+    @method_decorator(
+        cache_control(max_age=0, no_cache=True, must_revalidate=True, private=True)
+    )
     async def get(self, request, *args, **kwargs):
-        with self.get_executor() as executor:
-            self.results = await asyncio.gather(
-                *(check.get_result(executor) for check in self.get_checks())
-            )
+        if self.profiling and "profile" in request.GET and self.may_profile():
+            return await self.render_to_response_profile()
+        format_override = request.GET.get("format")
+        accept_header = request.headers.get("accept", "*/*")
+        # Stream before running the checks, since streaming results don't wait for them.
+        # An explicit format doesn't depend on the Accept header being valid.
+        media_type = None
+        if format_override is None:
+            media_type = next(MediaType.parse_header(accept_header), None)
+        match format_override, media_type:
+            case ("ndjson", _) | (None, MediaType(mime_type="application/x-ndjson")):
+                return self.render_to_response_ndjson(self.iter_results())
+            case ("sse", _) | (
+                None,
+                MediaType(mime_type="text/event-stream"),
+            ) if self.max_event_streams:
+                return self.render_to_response_event_stream()
+
+        self.results = await self.get_results()
+        response = self.render_to_response_results(
+            format_override, accept_header, **kwargs
+        )
+        if response.status_code != 200 or response.streaming:
+            return response
+        # OpenMetrics samples are measurements, which change with every run.
+        if response["Content-Type"].startswith("application/openmetrics-text"):
+            return response
+        response["ETag"] = self.get_etag(response["Content-Type"])
+        return get_conditional_response(
+            request, etag=response["ETag"], response=response
+        )
+
+    def render_to_response_results(self, format_override, accept_header, **kwargs):
+        """Return a response with the results in the requested format."""
         has_errors = any(result.error for result in self.results)
         status_code = 500 if has_errors else 200
-        format_override = request.GET.get("format")
 
         match format_override:
             case "json":
@@ -132,8 +342,9 @@ class HealthCheckView(TemplateView):
                 return self.render_to_response_rss()
             case "openmetrics":
                 return self.render_to_response_openmetrics()
+            case "health":
+                return self.render_to_response_health_json()
 
-        accept_header = request.headers.get("accept", "*/*")
         for media in MediaType.parse_header(accept_header):
             match media.mime_type:
                 case "text/plain":
@@ -141,6 +352,8 @@ class HealthCheckView(TemplateView):
                 case "text/html" | "application/xhtml+xml" | "text/*" | "*/*":
                     context = self.get_context_data(**kwargs)
                     return self.render_to_response(context, status=status_code)
+                case "application/health+json":
+                    return self.render_to_response_health_json()
                 case "application/json" | "application/*":
                     return self.render_to_response_json(status_code)
                 case "application/atom+xml":
@@ -149,12 +362,195 @@ class HealthCheckView(TemplateView):
                     return self.render_to_response_rss()
                 case "application/openmetrics-text":
                     return self.render_to_response_openmetrics()
+                case "application/x-ndjson":
+                    return self.render_to_response_ndjson(
+                        _aiter(self.results), status_code
+                    )
         return HttpResponse(
-            "Not Acceptable: Supported content types: text/plain, text/html, application/json, application/atom+xml, application/rss+xml, application/openmetrics-text",
+            "Not Acceptable: Supported content types: text/plain, text/html, application/json, application/atom+xml, application/rss+xml, application/openmetrics-text, application/x-ndjson, application/health+json",
             status=406,
             content_type="text/plain",
         )
 
+    def get_etag(self, content_type: str) -> str:
+        """
+        Return a weak ETag of the results' statuses for a response of the given type.
+
+        The ETag only changes with the status or error message of a check,
+        but not with its timings, which is why it is weak.
+        """
+        digest = (
+            get_digest(self.results) if self.snapshot is None else self.snapshot.digest
+        )
+        return f'W/"{digest}-{zlib.crc32(content_type.encode()):08x}"'
+
+    def may_profile(self) -> bool:
+        """Return whether the client is allowed to profile the checks."""
+        if self.profile_secret and hmac.compare_digest(
+            self.request.GET["profile"].encode(), self.profile_secret.encode()
+        ):
+            return True
+        return self.request.META.get("REMOTE_ADDR") in settings.INTERNAL_IPS
+
+    async def get_results(self) -> list[HealthCheckResult]:
+        """
+        Return scheduled or cached results if enabled, otherwise run all checks.
+
+        Concurrent requests to the same view share a single run of the checks.
+        """
+        match self.snapshot_cache, self.cache_timeout, self.refresh_interval:
+            case None, _, _:
+                self.snapshot = None
+                return await self.run_checks()
+            case SnapshotCache(), _, datetime.timedelta():
+                snapshot = await self.snapshot_cache.get_scheduled(
+                    self.run_checks,
+                    self.run_check,
+                    refresh_interval=self.refresh_interval,
+                )
+            case SnapshotCache(), None, None:
+                snapshot = await self.snapshot_cache.refresh(self.run_checks)
+            case _:
+                snapshot = await self.snapshot_cache.get(
+                    self.run_checks,
+                    max_age=self.cache_timeout,
+                    stale_while_revalidate=self.stale_while_revalidate,
+                )
+        self.snapshot = snapshot
+        return snapshot.results
+
+    async def iter_results(self) -> typing.AsyncIterator[HealthCheckResult]:
+        """
+        Yield the result of each check as soon as it finished.
+
+        Cached, scheduled or shared results are yielded at once. Otherwise, the checks
+        are run for this request alone and their results are yielded in the order
+        they finished. If the view fails fast, pending checks are cancelled
+        and yielded as skipped as soon as a critical check failed.
+        """
+        if (
+            self.cache_timeout is not None
+            or self.refresh_interval is not None
+            or self.fleet_cache is not None
+        ):
+            for result in await self.get_results():
+                yield result
+            return
+        start = timeit.default_timer()
+        with self.get_executor() as executor:
+            pending = {
+                id(check): (
+                    check,
+                    asyncio.ensure_future(self.get_check_result(check, executor)),
+                )
+                for check in self.get_checks()
+            }
+            try:
+                for future in asyncio.as_completed(
+                    [task for _, task in pending.values()]
+                ):
+                    result = await future
+                    del pending[id(result.check)]
+                    yield result
+                    if self.fail_fast and self.is_critical_failure(result):
+                        break
+                for check, task in pending.values():
+                    yield (
+                        task.result()
+                        if task.done()
+                        else HealthCheckResult(
+                            check=check,
+                            error=CheckSkipped("a critical check failed"),
+                            time_taken=timeit.default_timer() - start,
+                        )
+                    )
+            finally:
+                # Cancel the pending checks if the client disconnected or the view failed fast.
+                for _, task in pending.values():
+                    task.cancel()
+
+    async def run_checks(self) -> list[HealthCheckResult]:
+        """Run all checks, or read shared results if enabled, and return their results."""
+        if self.fleet_cache is None:
+            return await self.gather_results(self.get_checks())
+        return await self.fleet_cache.get_results(
+            list(self.get_checks()), self.gather_results
+        )
+
+    async def gather_results(
+        self, checks: typing.Iterable[HealthCheck]
+    ) -> list[HealthCheckResult]:
+        """
+        Run the given checks concurrently and return their results.
+
+        If the view fails fast, pending checks are cancelled
+        and reported as skipped as soon as a critical check failed.
+        """
+        start = timeit.default_timer()
+        with self.get_executor() as executor:
+            tasks = [
+                (check, asyncio.ensure_future(self.get_check_result(check, executor)))
+                for check in checks
+            ]
+            if not self.fail_fast:
+                return await asyncio.gather(*(task for _, task in tasks))
+            await self._wait_for_critical_error({task for _, task in tasks})
+        return [
+            task.result()
+            if task.done()
+            else HealthCheckResult(
+                check=check,
+                error=CheckSkipped("a critical check failed"),
+                time_taken=timeit.default_timer() - start,
+            )
+            for check, task in tasks
+        ]
+
+    async def _wait_for_critical_error(self, pending: set[asyncio.Future]) -> None:
+        if not pending:
+            return
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if any(self.is_critical_failure(task.result()) for task in done):
+            for task in pending:
+                task.cancel()
+        else:
+            await self._wait_for_critical_error(pending)
+
+    @staticmethod
+    def is_critical_failure(result: HealthCheckResult) -> bool:
+        """
+        Return whether the result skips pending checks, if the view fails fast.
+
+        Warnings don't, since the service is still operational.
+        """
+        match result.error:
+            case None | ServiceWarning():
+                return False
+        return result.check.critical
+
+    async def run_check(self, check: HealthCheck) -> HealthCheckResult:
+        """Run a single check, or read its shared result if enabled, and return it."""
+        if self.fleet_cache is None:
+            with self.get_executor() as executor:
+                return await self.get_check_result(check, executor)
+        (result,) = await self.fleet_cache.get_results([check], self.gather_results)
+        return result
+
+    async def get_check_result(
+        self, check: HealthCheck, executor: Executor | None
+    ) -> HealthCheckResult:
+        """Return the result of a single check within the view's limits."""
+        run = functools.partial(
+            check.get_result, executor, self.check_timeout, cpu_time=self.cpu_time
+        )
+        if self.concurrency_limit is not None:
+            run = functools.partial(self.concurrency_limit.get_result, check, run)
+        if self.circuit_breaker is not None:
+            run = functools.partial(self.circuit_breaker.get_result, check, run)
+        if tracing.tracer is not None:
+            run = functools.partial(tracing.get_result, check, run)
+        return await run()
+
     def get_context_data(self, **kwargs):
         return {
             **super().get_context_data(**kwargs),
@@ -166,7 +562,8 @@ class HealthCheckView(TemplateView):
         """
         Return a context manager providing an executor for synchronous checks.
 
-        Return a context manager that yields ``None`` to use the event loop's
+        Return a context manager that yields the process-wide executor
+        if `executor_max_workers` is set, or ``None`` to use the event loop's
         default executor.
 
         Example:
@@ -174,10 +571,28 @@ class HealthCheckView(TemplateView):
                 return ThreadPoolExecutor(max_workers=5)
 
         """
-        return contextlib.nullcontext(None)
+        if self.executor_max_workers is None:
+            return contextlib.nullcontext(None)
+        return contextlib.nullcontext(get_shared_executor(self.executor_max_workers))
 
     def render_to_response_json(self, status):
         """Return JSON response with health check results."""
+        if self.json_timings:
+            return JsonResponse(
+                {
+                    repr(result.check): {
+                        "status": "OK" if not result.error else str(result.error),
+                        "time_taken": result.time_taken,
+                        "queued_seconds": result.queued_seconds,
+                        "run_seconds": result.run_seconds,
+                        "cpu_seconds": result.cpu_seconds,
+                        "phases": result.phases,
+                    }
+                    | self.get_circuit_data(result.check)
+                    for result in self.results
+                },
+                status=status,
+            )
         return JsonResponse(
             {
                 repr(result.check): "OK" if not result.error else str(result.error)
@@ -186,6 +601,226 @@ class HealthCheckView(TemplateView):
             status=status,
         )
 
+    def render_to_response_ndjson(
+        self,
+        results: typing.AsyncIterable[HealthCheckResult],
+        status: int = 200,
+    ):
+        """
+        Return a streaming response with a JSON line per result as soon as it is available.
+
+        The response ends with a summary line. Since the response's status is sent
+        before the checks finished, the summary tells whether all checks passed.
+        """
+        return StreamingHttpResponse(
+            self._stream_ndjson(results),
+            content_type="application/x-ndjson",
+            status=status,
+        )
+
+    async def _stream_ndjson(
+        self, results: typing.AsyncIterable[HealthCheckResult]
+    ) -> typing.AsyncIterator[str]:
+        start = timeit.default_timer()
+        checks = errors = 0
+        async for result in results:
+            checks += 1
+            errors += result.error is not None
+            yield json.dumps(self.get_result_data(result), cls=DjangoJSONEncoder) + "\n"
+        summary = {
+            "healthy": not errors,
+            "checks": checks,
+            "errors": errors,
+            "time_taken": timeit.default_timer() - start,
+        }
+        yield json.dumps(summary, cls=DjangoJSONEncoder) + "\n"
+
+    def render_to_response_health_json(self):
+        """
+        Return a response in the `application/health+json` format with details of each check.
+
+        The report is serialized once per snapshot of the results and served again
+        until the results change. Since the draft requires a successful status code
+        for warnings, only failing checks result in a server error.
+
+        See also: https://datatracker.ietf.org/doc/html/draft-inadarei-api-health-check
+        """
+        if self.snapshot is None:
+            content = self.json_dumps(self.get_health_json_data())
+        else:
+            try:
+                content = self.snapshot.rendered["application/health+json"]
+            except KeyError:
+                content = self.json_dumps(self.get_health_json_data())
+                self.snapshot.rendered["application/health+json"] = content
+        has_failures = any(
+            result.error and not isinstance(result.error, ServiceWarning)
+            for result in self.results
+        )
+        return HttpResponse(
+            content,
+            content_type="application/health+json",
+            status=500 if has_failures else 200,
+        )
+
+    def get_health_json_data(self) -> dict[str, typing.Any]:
+        """Return the results in the `application/health+json` format."""
+        checks = {}
+        for result in self.results:
+            match result.error:
+                case None:
+                    status = "pass"
+                case ServiceWarning():
+                    status = "warn"
+                case _:
+                    status = "fail"
+            details = {
+                "componentId": repr(result.check),
+                "status": status,
+                "observedValue": result.time_taken,
+                "observedUnit": "s",
+                "labels": result.check.labels,
+            }
+            if result.error is not None:
+                details |= {
+                    "output": str(result.error),
+                    "errorType": f"{type(result.error).__module__}.{type(result.error).__qualname__}",
+                    "time": result.error.timestamp.isoformat(),
+                }
+            if self.json_timings:
+                details |= {
+                    "queuedSeconds": result.queued_seconds,
+                    "runSeconds": result.run_seconds,
+                    "cpuSeconds": result.cpu_seconds,
+                    "phases": result.phases,
+                }
+            details |= self.get_circuit_data(result.check)
+            checks.setdefault(
+                f"{result.check.labels['check']}:responseTime", []
+            ).append(details)
+        statuses = {
+            details["status"] for component in checks.values() for details in component
+        }
+        return {
+            "status": max(statuses, key=_HEALTH_JSON_STATUSES.index, default="pass"),
+            "checks": checks,
+        }
+
+    def get_result_data(self, result: HealthCheckResult) -> dict[str, typing.Any]:
+        """Return a check's result as a JSON-serializable dictionary."""
+        data = {
+            "check": repr(result.check),
+            "status": "OK" if not result.error else str(result.error),
+            "time_taken": result.time_taken,
+        }
+        if self.json_timings:
+            data |= {
+                "queued_seconds": result.queued_seconds,
+                "run_seconds": result.run_seconds,
+                "cpu_seconds": result.cpu_seconds,
+                "phases": result.phases,
+            }
+        return data | self.get_circuit_data(result.check)
+
+    def get_circuit_data(self, check: HealthCheck) -> dict[str, str]:
+        """Return the state of the check's circuit, if the view has a circuit breaker."""
+        if self.circuit_breaker is None:
+            return {}
+        return {"circuit": self.circuit_breaker.get_state(check).value}
+
+    def render_to_response_event_stream(self):
+        """
+        Return a Server-Sent Events response with the results of the scheduled runs.
+
+        All clients share the view's background runs of the checks. Each client
+        receives the results of all checks first and then every change of a
+        check's status as a `result` event, followed by a `summary` event.
+        """
+        if len(self.snapshot_cache.subscribers) >= self.max_event_streams:
+            return HttpResponse(
+                "Service Unavailable: Too many event streams",
+                content_type="text/plain; charset=utf-8",
+                status=503,
+                headers={
+                    "Retry-After": int(self.refresh_interval.total_seconds()) or 1
+                },
+            )
+        response = StreamingHttpResponse(
+            self._stream_events(self.snapshot_cache.subscribe()),
+            content_type="text/event-stream",
+        )
+        # Disable buffering by reverse proxies, like nginx.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def _stream_events(
+        self, snapshots: asyncio.Queue[Snapshot]
+    ) -> typing.AsyncIterator[str]:
+        statuses = {}
+        try:
+            snapshot = await self.snapshot_cache.get_scheduled(
+                self.run_checks,
+                self.run_check,
+                refresh_interval=self.refresh_interval,
+            )
+            while True:
+                changed = False
+                for index, result in enumerate(snapshot.results):
+                    status = "OK" if not result.error else str(result.error)
+                    if statuses.get(index) != status:
+                        statuses[index] = status
+                        changed = True
+                        yield self.get_event("result", self.get_result_data(result))
+                if changed:
+                    errors = sum(status != "OK" for status in statuses.values())
+                    yield self.get_event(
+                        "summary",
+                        {
+                            "healthy": not errors,
+                            "checks": len(statuses),
+                            "errors": errors,
+                        },
+                    )
+                try:
+                    snapshot = await asyncio.wait_for(
+                        snapshots.get(), self.event_stream_heartbeat.total_seconds()
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+        finally:
+            self.snapshot_cache.unsubscribe(snapshots)
+
+    @staticmethod
+    def get_event(event: str, data: dict[str, typing.Any]) -> str:
+        """Return a Server-Sent Event of the given type with JSON data."""
+        return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+    async def render_to_response_profile(self):
+        """Return JSON response with the functions each check spent the most time in."""
+        try:
+            profiles = await profile_checks(
+                self.get_checks(), timeout=self.check_timeout
+            )
+        except ProfilerBusy:
+            return HttpResponse(
+                "Service Unavailable: Another profile is being recorded",
+                content_type="text/plain; charset=utf-8",
+                status=503,
+            )
+        return JsonResponse(
+            {
+                repr(profile.result.check): {
+                    "status": "OK"
+                    if not profile.result.error
+                    else str(profile.result.error),
+                    "time_taken": profile.result.time_taken,
+                    "frames": [dataclasses.asdict(frame) for frame in profile.frames],
+                }
+                for profile in profiles
+            },
+            status=500 if any(profile.result.error for profile in profiles) else 200,
+        )
+
     def render_to_response_text(self, status):
         """Return a plain text response with health check results."""
         lines = (
@@ -225,36 +860,116 @@ class HealthCheckView(TemplateView):
             f'{key}="{HealthCheckView.abnf_escape(value)}"' for key, value in o.items()
         )
 
+    def get_openmetrics_labels(self, check: HealthCheck) -> str:
+        """Return the check's escaped OpenMetrics labels, precompiled if possible."""
+        if self.openmetrics_labels is not None and (
+            labels := self.openmetrics_labels.get(id(check))
+        ):
+            return labels
+        return self.abnf_dumps(check.labels)
+
     def render_to_response_openmetrics(self):
         """Return OpenMetrics response with health check results."""
-        lines = [
-            "# HELP django_health_check_status Health check status (1 = healthy, 0 = unhealthy)",
-            "# TYPE django_health_check_status gauge",
+        preambles = _OPENMETRICS_PREAMBLES
+        results = [
+            (self.get_openmetrics_labels(result.check), result)
+            for result in self.results
         ]
-        has_errors: bool = False
+        has_errors = any(result.error for result in self.results)
 
         # Add status metrics for each check
-        for result in self.results:
-            has_errors |= bool(result.error)
-            lines.append(
-                f"django_health_check_status{{{self.abnf_dumps(result.check.labels)}}} {not result.error:d}"
-            )
+        lines = [preambles["django_health_check_status"]]
+        lines += (
+            f"django_health_check_status{{{labels}}} {not result.error:d}"
+            for labels, result in results
+        )
 
         # Add response time metrics
+        lines.append(preambles["django_health_check_response_time_seconds"])
+        lines += (
+            f"django_health_check_response_time_seconds{{{labels}}} {result.time_taken:.6f}"
+            for labels, result in results
+        )
+
+        # Add response time of the phases of each check
+        lines.append(preambles["django_health_check_phase_seconds"])
+        lines += (
+            f'django_health_check_phase_seconds{{{labels},phase="{self.abnf_escape(phase)}"}} {time_taken:.6f}'
+            for labels, result in results
+            for phase, time_taken in result.phases.items()
+        )
+
+        # Add response time distributions across all runs of this process
         lines += [
-            "# HELP django_health_check_response_time_seconds Health check response time in seconds",
-            "# TYPE django_health_check_response_time_seconds gauge",
+            preambles["django_health_check_latency_seconds"],
+            *self.get_histogram_samples(
+                "django_health_check_latency_seconds", metrics.response_time
+            ),
         ]
 
-        for result in self.results:
-            lines.append(
-                f"django_health_check_response_time_seconds{{{self.abnf_dumps(result.check.labels)}}} {result.time_taken:.6f}"
+        if event_loop_lag := self.get_histogram_samples(
+            "django_health_check_event_loop_lag_seconds", metrics.event_loop_lag
+        ):
+            lines += [
+                preambles["django_health_check_event_loop_lag_seconds"],
+                *event_loop_lag,
+            ]
+
+        lines += [
+            preambles["django_health_check_hook_signals_dropped"],
+            f"django_health_check_hook_signals_dropped_total {hooks.dispatcher.dropped}",
+        ]
+
+        if self.cpu_time:
+            lines.append(preambles["django_health_check_cpu_seconds"])
+            lines += (
+                f"django_health_check_cpu_seconds{{{labels}}} {result.cpu_seconds:.6f}"
+                for labels, result in results
+                if result.cpu_seconds is not None
             )
 
+        if self.executor_max_workers is not None:
+            stats = get_shared_executor(self.executor_max_workers).stats
+            lines += [
+                preambles["django_health_check_executor_max_workers"],
+                f"django_health_check_executor_max_workers {stats.max_workers}",
+                preambles["django_health_check_executor_queued"],
+                f"django_health_check_executor_queued {stats.queued}",
+                preambles["django_health_check_executor_running"],
+                f"django_health_check_executor_running {stats.running}",
+            ]
+
+        # Add time queued for a thread or the concurrency limit, apart from the run time
+        lines.append(preambles["django_health_check_queued_seconds"])
+        lines += (
+            f"django_health_check_queued_seconds{{{labels}}} {result.queued_seconds:.6f}"
+            for labels, result in results
+        )
+        lines.append(preambles["django_health_check_run_seconds"])
+        lines += (
+            f"django_health_check_run_seconds{{{labels}}} {result.run_seconds:.6f}"
+            for labels, result in results
+        )
+
+        if self.fail_fast:
+            lines.append(preambles["django_health_check_skipped"])
+            lines += (
+                f"django_health_check_skipped{{{labels}}} {isinstance(result.error, CheckSkipped):d}"
+                for labels, result in results
+            )
+
+        if self.circuit_breaker is not None:
+            lines.append(preambles["django_health_check_circuit"])
+            for labels, result in results:
+                circuit_state = self.circuit_breaker.get_state(result.check)
+                lines += (
+                    f'django_health_check_circuit{{{labels},django_health_check_circuit="{state.value}"}} {state is circuit_state:d}'
+                    for state in CircuitState
+                )
+
         # Add overall health status
         lines += [
-            "# HELP django_health_check_overall_status Overall health check status (1 = all healthy, 0 = at least one unhealthy)",
-            "# TYPE django_health_check_overall_status gauge",
+            preambles["django_health_check_overall_status"],
             f"django_health_check_overall_status {not has_errors:d}",
             "# EOF",
         ]
@@ -265,6 +980,29 @@ class HealthCheckView(TemplateView):
             status=200,  # Prometheus expects 200 even if checks fail
         )
 
+    def get_histogram_samples(
+        self, name: str, family: metrics.HistogramFamily
+    ) -> list[str]:
+        """Return OpenMetrics histogram samples of the family for the checks of the results."""
+        lines = []
+        for key, labels in {
+            tuple(result.check.labels.items()): self.get_openmetrics_labels(
+                result.check
+            )
+            for result in self.results
+        }.items():
+            if (histogram := family.get(key)) is None:
+                continue
+            lines += (
+                f'{name}_bucket{{{labels},le="{"+Inf" if bound == float("inf") else bound}"}} {count}'
+                for bound, count in histogram.cumulative_counts()
+            )
+            lines += [
+                f"{name}_count{{{labels}}} {histogram.count}",
+                f"{name}_sum{{{labels}}} {histogram.sum:.6f}",
+            ]
+        return lines
+
     def _render_feed(self, feed_class):
         """Generate RSS or Atom feed with health check results."""
         feed = feed_class(
@@ -301,7 +1039,17 @@ class HealthCheckView(TemplateView):
         self,
     ) -> typing.Generator[HealthCheck, None, None]:
         """Yield instantiated health check callables."""
-        for check in self.checks:
+        if self.compiled_checks is None:
+            yield from self.compile_checks(self.checks)
+        else:
+            yield from self.compiled_checks
+
+    @staticmethod
+    def compile_checks(
+        checks: typing.Iterable[CheckDefinition],
+    ) -> typing.Generator[HealthCheck, None, None]:
+        """Import and instantiate the given health checks."""
+        for check in checks:
             try:
                 check, options = check
             except (ValueError, TypeError):
@@ -309,3 +1057,8 @@ class HealthCheckView(TemplateView):
             if isinstance(check, str):
                 check = import_string(check)
             yield check(**options)
+
+
+async def _aiter(iterable: typing.Iterable) -> typing.AsyncIterator:
+    for item in iterable:
+        yield item
@@ -188,6 +188,15 @@ class TestRedis:
             "repr should include the db from the deprecated client"
         )
 
+    def test_redis__repr_cached(self):
+        """Create a single client to represent the check."""
+        from redis.asyncio import Redis as RedisClient
+
+        client_factory = mock.Mock(return_value=RedisClient(host="myhost"))
+        check = RedisHealthCheck(client_factory=client_factory)
+        assert repr(check) == repr(check)
+        client_factory.assert_called_once_with()
+
     def test_redis__repr_sentinel_client(self):
         """Verify repr falls back gracefully for Sentinel clients without host/db."""
         from redis.asyncio import Sentinel
@@ -1,11 +1,14 @@
 import asyncio
 import dataclasses
-from unittest.mock import MagicMock, patch
+import datetime
+import threading
+import time
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
 from health_check.base import HealthCheck, HealthCheckResult
-from health_check.exceptions import HealthCheckException
+from health_check.exceptions import HealthCheckException, ServiceUnavailable
 
 
 class TestHealthCheck:
@@ -37,6 +40,20 @@ class TestHealthCheck:
         assert isinstance(result.error, HealthCheckException)
         assert str(result.error) == "Unknown Error: unknown error"
 
+    @pytest.mark.asyncio
+    async def test_run__cancelled(self):
+        """Propagate cancellation instead of reporting an error."""
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(HangingCheck().get_result())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
     @pytest.mark.asyncio
     async def test_run__sync_check(self):
         """Execute synchronous run method in thread."""
@@ -63,7 +80,7 @@ class TestHealthCheck:
         loop = asyncio.get_running_loop()
         with patch.object(loop, "run_in_executor", wraps=loop.run_in_executor) as mock:
             await check.get_result(executor=custom_executor)
-        mock.assert_called_once_with(custom_executor, check.run)
+        mock.assert_called_once_with(custom_executor, ANY, check._run_sync, ANY)
 
     @pytest.mark.asyncio
     async def test_run__sync_check_default_executor(self):
@@ -77,7 +94,7 @@ class TestHealthCheck:
         loop = asyncio.get_running_loop()
         with patch.object(loop, "run_in_executor", wraps=loop.run_in_executor) as mock:
             result = await check.get_result()
-        mock.assert_called_once_with(None, check.run)
+        mock.assert_called_once_with(None, ANY, check._run_sync, ANY)
         assert result.error is None
 
     @pytest.mark.asyncio
@@ -94,6 +111,277 @@ class TestHealthCheck:
         result = await check.get_result()
         assert result.time_taken > 0
 
+    @pytest.mark.asyncio
+    async def test_get_result__timeout_async(self):
+        """Report async checks exceeding the timeout as unavailable."""
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(10)
+
+        result = await HangingCheck().get_result(
+            timeout=datetime.timedelta(milliseconds=10)
+        )
+        assert isinstance(result.error, ServiceUnavailable)
+        assert str(result.error) == "Unavailable: timeout"
+        assert 0.01 <= result.time_taken < 10
+
+    @pytest.mark.asyncio
+    async def test_get_result__timeout_not_exceeded(self):
+        """Return the check's result when it finishes within the timeout."""
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        result = await SyncCheck().get_result(timeout=datetime.timedelta(seconds=10))
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_get_result__timeout_sync(self):
+        """Report sync checks exceeding the timeout as unavailable."""
+        release = threading.Event()
+
+        @dataclasses.dataclass
+        class HangingCheck(HealthCheck):
+            def run(self):
+                release.wait(10)
+
+        try:
+            result = await HangingCheck().get_result(
+                timeout=datetime.timedelta(milliseconds=10)
+            )
+        finally:
+            release.set()
+        assert str(result.error) == "Unavailable: timeout"
+        assert result.time_taken >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_get_result__timeout_abandoned_run(self):
+        """Do not run a sync check again while its timed out run is still pending."""
+        release = threading.Event()
+        calls = []
+
+        @dataclasses.dataclass
+        class HangingCheck(HealthCheck):
+            def run(self):
+                calls.append(None)
+                release.wait(10)
+
+        timeout = datetime.timedelta(milliseconds=10)
+        await HangingCheck().get_result(timeout=timeout)
+        result = await HangingCheck().get_result(timeout=timeout)
+        assert str(result.error) == "Unavailable: timeout"
+        assert len(calls) == 1
+
+        release.set()
+        await asyncio.sleep(0.05)
+        result = await HangingCheck().get_result(timeout=datetime.timedelta(seconds=1))
+        assert result.error is None
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_phase__async(self):
+        """Report the time taken by the phases of async checks."""
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    await asyncio.sleep(0.01)
+                with self.phase("query"):
+                    pass
+
+        result = await PhasedCheck().get_result()
+        assert list(result.phases) == ["connect", "query"]
+        assert result.phases["connect"] >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_phase__sync(self):
+        """Report the time taken by the phases of sync checks run in a thread."""
+
+        class PhasedCheck(HealthCheck):
+            def run(self):
+                with self.phase("connect"):
+                    pass
+
+        result = await PhasedCheck().get_result()
+        assert list(result.phases) == ["connect"]
+
+    @pytest.mark.asyncio
+    async def test_phase__repeated(self):
+        """Add up the time of phases sharing the same name."""
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("query"):
+                    await asyncio.sleep(0.01)
+                with self.phase("query"):
+                    await asyncio.sleep(0.01)
+
+        result = await PhasedCheck().get_result()
+        assert result.phases["query"] >= 0.02
+
+    @pytest.mark.asyncio
+    async def test_phase__failed(self):
+        """Report the time taken by a phase that raised an error."""
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    raise ServiceUnavailable("down")
+
+        result = await PhasedCheck().get_result()
+        assert isinstance(result.error, ServiceUnavailable)
+        assert list(result.phases) == ["connect"]
+
+    @pytest.mark.asyncio
+    async def test_phase__isolated_runs(self):
+        """Keep the phases of concurrent runs of the same check apart."""
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    await asyncio.sleep(0.01)
+
+        check = PhasedCheck()
+        results = await asyncio.gather(check.get_result(), check.get_result())
+        assert [list(result.phases) for result in results] == [
+            ["connect"],
+            ["connect"],
+        ]
+        assert results[0].phases is not results[1].phases
+
+    def test_phase__outside_get_result(self):
+        """Run the phase without recording it outside of get_result."""
+
+        class PhasedCheck(HealthCheck):
+            def run(self):
+                with self.phase("connect"):
+                    return "done"
+
+        assert PhasedCheck().run() == "done"
+
+    @pytest.mark.asyncio
+    async def test_get_result__queued_seconds(self):
+        """Separate the time a sync check waited for a thread from its run time."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+
+        class BlockingCheck(HealthCheck):
+            def run(self):
+                release.wait(10)
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        with ThreadPoolExecutor(1) as executor:
+            blocking = asyncio.ensure_future(BlockingCheck().get_result(executor))
+            queued = asyncio.ensure_future(SyncCheck().get_result(executor))
+            await asyncio.sleep(0.05)
+            release.set()
+            blocking_result, queued_result = await asyncio.gather(blocking, queued)
+        assert blocking_result.run_seconds >= 0.05
+        assert queued_result.queued_seconds >= 0.05
+        assert queued_result.run_seconds < 0.05
+        assert queued_result.time_taken == pytest.approx(
+            queued_result.queued_seconds + queued_result.run_seconds
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_result__run_seconds_async(self):
+        """Report the whole time taken of async checks as run time."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        result = await SuccessCheck().get_result()
+        assert result.queued_seconds == 0
+        assert result.run_seconds == result.time_taken
+
+    @pytest.mark.asyncio
+    async def test_get_result__cpu_time_not_measured(self):
+        """Don't measure CPU time by default."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        result = await SuccessCheck().get_result()
+        assert result.cpu_seconds is None
+
+    @pytest.mark.asyncio
+    async def test_get_result__cpu_time_sync(self):
+        """Measure the CPU time of sync checks in their thread apart from waiting."""
+
+        class BusyCheck(HealthCheck):
+            def run(self):
+                deadline = time.thread_time() + 0.02
+                while time.thread_time() < deadline:
+                    pass
+                time.sleep(0.05)
+
+        result = await BusyCheck().get_result(cpu_time=True)
+        assert 0.02 <= result.cpu_seconds < 0.05 <= result.run_seconds
+
+    @pytest.mark.asyncio
+    async def test_get_result__cpu_time_async(self):
+        """Measure the CPU time of async checks only while they are running."""
+
+        class BusyCheck(HealthCheck):
+            async def run(self):
+                deadline = time.thread_time() + 0.02
+                while time.thread_time() < deadline:
+                    pass
+                await asyncio.sleep(0.05)
+                return "ignored"
+
+        async def busy_task():
+            await asyncio.sleep(0.01)
+            deadline = time.thread_time() + 0.05
+            while time.thread_time() < deadline:
+                pass
+
+        task = asyncio.ensure_future(busy_task())
+        result = await BusyCheck().get_result(cpu_time=True)
+        await task
+        assert result.error is None
+        assert 0.02 <= result.cpu_seconds < 0.05
+
+    @pytest.mark.asyncio
+    async def test_get_result__cpu_time_async_error(self):
+        """Measure the CPU time of async checks that raise an error."""
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(0)
+                raise ServiceUnavailable("down")
+
+        result = await FailingCheck().get_result(cpu_time=True)
+        assert isinstance(result.error, ServiceUnavailable)
+        assert result.cpu_seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_get_result__cpu_time_async_timeout(self):
+        """Cancel async checks measuring CPU time on timeout."""
+        cancelled = []
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+
+        result = await HangingCheck().get_result(
+            timeout=datetime.timedelta(milliseconds=10), cpu_time=True
+        )
+        assert str(result.error) == "Unavailable: timeout"
+        assert cancelled == [True]
+
     def test_labels(self):
         """Labels include class name and dataclass fields, excluding secret fields."""
 
@@ -109,3 +397,19 @@ class TestHealthCheck:
 
         check = LabeledCheck()
         assert check.labels == {"check": "LabeledCheck", "foo": "bar", "version": "1.0"}
+
+    def test_labels__cached(self):
+        """Compute the labels only once per check instance."""
+
+        @dataclasses.dataclass
+        class LabeledCheck(HealthCheck):
+            foo: str = "bar"
+
+            async def run(self):
+                pass
+
+        check = LabeledCheck()
+        with patch("dataclasses.fields", wraps=dataclasses.fields) as fields:
+            assert check.labels is check.labels
+        fields.assert_called_once_with(check)
+        assert LabeledCheck(foo="baz").labels["foo"] == "baz"
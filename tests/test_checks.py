@@ -1,18 +1,21 @@
 """Integration tests for health check implementations."""
 
+import asyncio
 import datetime
 import logging
+import time
 from unittest import mock
 
 import pytest
 from django import db
 from django.core.cache import CacheKeyWarning
 
-from health_check import Storage
-from health_check.checks import DNS, Cache, Database, Mail
+from health_check import Storage, metrics
+from health_check.checks import DNS, Cache, Database, EventLoopLag, Mail
 from health_check.exceptions import (
     ServiceReturnedUnexpectedResult,
     ServiceUnavailable,
+    ServiceWarning,
 )
 
 
@@ -36,6 +39,12 @@ class TestCache:
         result = await check.get_result()
         assert result.error is None
 
+    @pytest.mark.asyncio
+    async def test_run_check__phases(self):
+        """Report the time taken to set and get the value."""
+        result = await Cache().get_result()
+        assert list(result.phases) == ["set", "get"]
+
     @pytest.mark.asyncio
     async def test_run_check__cache_uses_unique_runtime_key(self):
         """Cache check uses an isolated cache key per run to avoid race conditions."""
@@ -153,6 +162,40 @@ class TestDNS:
         assert result.error is None
 
 
+class TestEventLoopLag:
+    """Test the EventLoopLag health check."""
+
+    @pytest.mark.asyncio
+    async def test_run_check__responsive(self):
+        """Event loop responds within the maximum lag."""
+        check = EventLoopLag(max_lag=datetime.timedelta(seconds=1))
+        result = await check.get_result()
+        assert result.error is None
+        histogram = metrics.event_loop_lag.get(tuple(check.labels.items()))
+        assert histogram.count >= 1
+
+    @pytest.mark.asyncio
+    async def test_run_check__blocked(self):
+        """Raise ServiceWarning when a callback is delayed beyond the maximum lag."""
+        check = EventLoopLag(
+            max_lag=datetime.timedelta(milliseconds=10),
+            samples=1,
+            interval=datetime.timedelta(milliseconds=10),
+        )
+        asyncio.get_running_loop().call_soon(time.sleep, 0.05)
+        result = await check.get_result()
+        assert isinstance(result.error, ServiceWarning)
+        assert "Event loop lag" in str(result.error)
+
+    @pytest.mark.asyncio
+    async def test_run_check__timeout(self):
+        """Ignore callbacks that fire after the check timed out."""
+        check = EventLoopLag(samples=1, interval=datetime.timedelta(milliseconds=50))
+        result = await check.get_result(timeout=datetime.timedelta(milliseconds=1))
+        assert str(result.error) == "Unavailable: timeout"
+        await asyncio.sleep(0.1)
+
+
 class TestMail:
     """Test the Mail health check."""
 
@@ -163,6 +206,13 @@ class TestMail:
         result = await check.get_result()
         assert result.error is None
 
+    @pytest.mark.asyncio
+    async def test_run_check__phases(self):
+        """Report the time taken to open and close the connection."""
+        check = Mail(backend="django.core.mail.backends.locmem.EmailBackend")
+        result = await check.get_result()
+        assert list(result.phases) == ["open", "close"]
+
 
 class TestStorage:
     """Test the Storage health check."""
@@ -184,6 +234,12 @@ class TestStorage:
         result = await check.get_result()
         assert result.error is None
 
+    @pytest.mark.asyncio
+    async def test_run_check__phases(self):
+        """Report the time taken by each storage operation."""
+        result = await Storage().get_result()
+        assert list(result.phases) == ["save", "exists", "read", "delete"]
+
 
 class TestServiceUnavailable:
     """Test ServiceUnavailable exception formatting."""
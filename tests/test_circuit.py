@@ -0,0 +1,134 @@
+import asyncio
+import dataclasses
+import datetime
+
+import pytest
+
+from health_check.base import HealthCheck
+from health_check.circuit import Circuit, CircuitBreaker, CircuitState
+from health_check.exceptions import CircuitOpen, ServiceUnavailable, ServiceWarning
+
+
+@dataclasses.dataclass
+class FlakyCheck(HealthCheck):
+    name: str = "flaky"
+    failing: bool = dataclasses.field(default=True, repr=False)
+    runs: int = dataclasses.field(default=0, repr=False)
+
+    async def run(self):
+        self.runs += 1
+        await asyncio.sleep(0)
+        if self.failing:
+            raise ServiceUnavailable("down")
+
+
+class TestCircuitBreaker:
+    def test_get_state__unknown_check(self):
+        """Report unknown checks as closed."""
+        assert CircuitBreaker().get_state(FlakyCheck()) is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_get_result__below_threshold(self):
+        """Run failing checks until the failure threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        check = FlakyCheck()
+        for _ in range(2):
+            result = await breaker.get_result(check, check.get_result)
+            assert str(result.error) == "Unavailable: down"
+        assert check.runs == 2
+        assert breaker.get_state(check) is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_get_result__open(self):
+        """Report the last error without running the check while the circuit is open."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        check = FlakyCheck()
+        last = None
+        for _ in range(2):
+            last = await breaker.get_result(check, check.get_result)
+        assert breaker.get_state(check) is CircuitState.OPEN
+
+        result = await breaker.get_result(check, check.get_result)
+        assert check.runs == 2
+        assert isinstance(result.error, CircuitOpen)
+        assert str(result.error) == "Circuit open: Unavailable: down"
+        assert result.error.timestamp == last.error.timestamp
+        assert result.time_taken == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_result__warning(self):
+        """Keep running checks that report warnings and reset their failures."""
+
+        @dataclasses.dataclass
+        class WarningCheck(HealthCheck):
+            runs: int = dataclasses.field(default=0, repr=False)
+
+            async def run(self):
+                self.runs += 1
+                raise ServiceWarning("degraded")
+
+        breaker = CircuitBreaker(failure_threshold=2)
+        check = WarningCheck()
+        breaker.circuits[repr(check)] = Circuit(failures=1)
+        for _ in range(3):
+            result = await breaker.get_result(check, check.get_result)
+            assert str(result.error) == "Warning: degraded"
+        assert check.runs == 3
+        assert breaker.circuits[repr(check)].failures == 0
+        assert breaker.get_state(check) is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_get_result__half_open_success(self):
+        """Close the circuit if the probe after the cooldown succeeds."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=datetime.timedelta(0))
+        check = FlakyCheck()
+        await breaker.get_result(check, check.get_result)
+        assert breaker.get_state(check) is CircuitState.HALF_OPEN
+
+        check.failing = False
+        result = await breaker.get_result(check, check.get_result)
+        assert result.error is None
+        assert check.runs == 2
+        assert breaker.get_state(check) is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_get_result__half_open_failure(self):
+        """Open the circuit again if the probe after the cooldown fails."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=datetime.timedelta(0))
+        check = FlakyCheck()
+        await breaker.get_result(check, check.get_result)
+        breaker.cooldown = datetime.timedelta(minutes=1)
+        breaker.circuits[repr(check)].opened_at = 0.0
+
+        result = await breaker.get_result(check, check.get_result)
+        assert str(result.error) == "Unavailable: down"
+        assert check.runs == 2
+        assert breaker.get_state(check) is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_get_result__single_probe(self):
+        """Let a single probe through while the circuit is half-open."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=datetime.timedelta(0))
+        check = FlakyCheck()
+        await breaker.get_result(check, check.get_result)
+
+        results = await asyncio.gather(
+            *(breaker.get_result(check, check.get_result) for _ in range(3))
+        )
+        assert check.runs == 2
+        assert sum(isinstance(result.error, CircuitOpen) for result in results) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_result__shared_by_representation(self):
+        """Share circuits between checks with the same representation."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        check = FlakyCheck()
+        await breaker.get_result(check, check.get_result)
+        assert breaker.get_state(FlakyCheck()) is CircuitState.OPEN
+        assert breaker.get_state(FlakyCheck(name="other")) is CircuitState.CLOSED
+
+    def test_get_state__probing(self):
+        """Report checks with a pending probe as half-open."""
+        breaker = CircuitBreaker()
+        breaker.circuits[repr(FlakyCheck())] = Circuit(failures=5, probing=True)
+        assert breaker.get_state(FlakyCheck()) is CircuitState.HALF_OPEN
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from health_check import hooks
+from health_check.base import HealthCheck
+from health_check.concurrency import ConcurrencyLimit
+
+
+class TrackedCheck(HealthCheck):
+    running = 0
+    max_running = 0
+
+    async def run(self):
+        TrackedCheck.running += 1
+        TrackedCheck.max_running = max(TrackedCheck.max_running, TrackedCheck.running)
+        await asyncio.sleep(0.01)
+        TrackedCheck.running -= 1
+
+
+class TestConcurrencyLimit:
+    @pytest.fixture(autouse=True)
+    def reset_checks(self):
+        TrackedCheck.running = TrackedCheck.max_running = 0
+
+    @pytest.mark.asyncio
+    async def test_get_result__max_concurrency(self):
+        """Run no more checks at once than the limit allows."""
+        limit = ConcurrencyLimit(max_concurrency=2)
+        checks = [TrackedCheck() for _ in range(6)]
+        results = await asyncio.gather(
+            *(limit.get_result(check, check.get_result) for check in checks)
+        )
+        assert TrackedCheck.max_running == 2
+        assert [result.check for result in results] == checks
+        assert max(result.queued_seconds for result in results) >= 0.01
+        assert min(result.queued_seconds for result in results) < 0.01
+        assert all(result.time_taken >= result.queued_seconds for result in results)
+
+    @pytest.mark.asyncio
+    async def test_get_result__time_queued_reported(self):
+        """Send the time queued for the limit to hooks as part of the time taken."""
+        finished = []
+
+        def receiver(sender, result, **kwargs):
+            finished.append(result)
+
+        hooks.check_finished.connect(receiver, sender=TrackedCheck, weak=False)
+        try:
+            limit = ConcurrencyLimit(max_concurrency=1)
+            checks = [TrackedCheck(), TrackedCheck()]
+            results = await asyncio.gather(
+                *(limit.get_result(check, check.get_result) for check in checks)
+            )
+            hooks.dispatcher.queue.join()
+        finally:
+            hooks.check_finished.disconnect(receiver, sender=TrackedCheck)
+        assert max(result.time_taken for result in results) >= 0.02
+        assert sorted(result.time_taken for result in finished) == sorted(
+            result.time_taken for result in results
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_result__check_max_concurrency(self):
+        """Run no more checks of a type at once than the type allows."""
+
+        class LimitedCheck(TrackedCheck):
+            max_concurrency = 1
+
+        limit = ConcurrencyLimit(max_concurrency=10)
+        checks = [LimitedCheck() for _ in range(3)]
+        await asyncio.gather(
+            *(limit.get_result(check, check.get_result) for check in checks)
+        )
+        assert TrackedCheck.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_get_result__shared_instance(self):
+        """Apply the limit across separate runs sharing the instance."""
+        limit = ConcurrencyLimit(max_concurrency=1)
+
+        async def run_all():
+            return await asyncio.gather(
+                *(
+                    limit.get_result(check, check.get_result)
+                    for check in [TrackedCheck(), TrackedCheck()]
+                )
+            )
+
+        await asyncio.gather(run_all(), run_all())
+        assert TrackedCheck.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_get_semaphore__per_loop(self):
+        """Return the same semaphore within the running loop."""
+        limit = ConcurrencyLimit()
+        assert limit.get_semaphore(None, 1) is limit.get_semaphore(None, 1)
+        assert limit.get_semaphore(TrackedCheck, 1) is not limit.get_semaphore(None, 1)
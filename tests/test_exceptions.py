@@ -6,6 +6,8 @@ import pytest
 from django.utils import timezone
 
 from health_check.exceptions import (
+    CheckSkipped,
+    CircuitOpen,
     HealthCheckException,
     ServiceReturnedUnexpectedResult,
     ServiceUnavailable,
@@ -96,6 +98,30 @@ class TestServiceUnavailable:
             raise ServiceUnavailable("unavailable message")
 
 
+class TestCircuitOpen:
+    def test_str__format_with_circuit_open_type(self):
+        """Format string with 'circuit open' message type."""
+        exc = CircuitOpen("Unavailable: down")
+        assert str(exc) == "Circuit open: Unavailable: down"
+
+    def test_inherits_from_service_unavailable(self):
+        """Inherit from ServiceUnavailable."""
+        exc = CircuitOpen("test")
+        assert isinstance(exc, ServiceUnavailable)
+
+
+class TestCheckSkipped:
+    def test_str__format_with_skipped_type(self):
+        """Format string with 'skipped' message type."""
+        exc = CheckSkipped("a critical check failed")
+        assert str(exc) == "Skipped: a critical check failed"
+
+    def test_inherits_from_health_check_exception(self):
+        """Inherit from HealthCheckException."""
+        exc = CheckSkipped("test")
+        assert isinstance(exc, HealthCheckException)
+
+
 class TestServiceReturnedUnexpectedResult:
     def test_str__format_with_unexpected_result_type(self):
         """Format string with 'unexpected result' message type."""
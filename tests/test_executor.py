@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from health_check.executor import (
+    ExecutorStats,
+    HealthCheckExecutor,
+    get_shared_executor,
+)
+
+
+class TestHealthCheckExecutor:
+    def test_stats__idle(self):
+        """Report no queued or running calls for an idle executor."""
+        with HealthCheckExecutor(max_workers=2) as executor:
+            assert executor.stats == ExecutorStats(max_workers=2, queued=0, running=0)
+
+    def test_stats__busy(self):
+        """Report queued and running calls."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(10)
+
+        with HealthCheckExecutor(max_workers=1) as executor:
+            futures = [executor.submit(block) for _ in range(3)]
+            started.wait(10)
+            assert executor.stats == ExecutorStats(max_workers=1, queued=2, running=1)
+            release.set()
+            for future in futures:
+                future.result()
+            assert executor.stats == ExecutorStats(max_workers=1, queued=0, running=0)
+
+    def test_stats__cancelled(self):
+        """Do not count cancelled calls as queued."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(10)
+
+        with HealthCheckExecutor(max_workers=1) as executor:
+            executor.submit(block)
+            started.wait(10)
+            assert executor.submit(block).cancel()
+            assert executor.stats.queued == 0
+            release.set()
+
+    def test_submit__result(self):
+        """Return the result of the submitted call."""
+        with HealthCheckExecutor(max_workers=1) as executor:
+            assert executor.submit(sum, [1, 2], start=3).result() == 6
+
+    def test_submit__exception(self):
+        """Propagate exceptions and release the worker."""
+        with HealthCheckExecutor(max_workers=1) as executor:
+            with pytest.raises(ZeroDivisionError):
+                executor.submit(divmod, 1, 0).result()
+            assert executor.stats.running == 0
+
+    def test_submit__shutdown(self):
+        """Do not count calls rejected by a shut down executor."""
+        executor = HealthCheckExecutor(max_workers=1)
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.submit(sum, [])
+        assert executor.stats.queued == 0
+
+
+def test_get_shared_executor():
+    """Return the same executor for the same number of workers."""
+    assert get_shared_executor(3) is get_shared_executor(3)
+    assert get_shared_executor(3) is not get_shared_executor(4)
+    assert get_shared_executor(3).stats.max_workers == 3
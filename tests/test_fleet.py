@@ -0,0 +1,174 @@
+import dataclasses
+import datetime
+import pickle
+import time
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from health_check.base import HealthCheck, HealthCheckResult
+from health_check.exceptions import HealthCheckException, ServiceWarning
+from health_check.fleet import FleetCache
+
+
+@dataclasses.dataclass
+class SharedCheck(HealthCheck):
+    name: str = "shared"
+
+    async def run(self):
+        pass
+
+
+@dataclasses.dataclass
+class NodeCheck(HealthCheck):
+    node_local = True
+
+    async def run(self):
+        pass
+
+
+class CustomError(HealthCheckException):
+    message_type = "Custom"
+
+
+class TestFleetCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    @pytest.fixture
+    def run_checks(self):
+        runs = []
+
+        async def run_checks(checks):
+            if checks:
+                runs.append(list(checks))
+            return [await check.get_result() for check in checks]
+
+        run_checks.runs = runs
+        return run_checks
+
+    @pytest.mark.asyncio
+    async def test_get_results__shared(self, run_checks):
+        """Run shared checks in a single process and read the results in others."""
+        fleet_cache = FleetCache()
+        first = await fleet_cache.get_results([SharedCheck()], run_checks)
+        check = SharedCheck()
+        second = await fleet_cache.get_results([check], run_checks)
+        assert len(run_checks.runs) == 1
+        assert second[0].check is check
+        assert second[0].error is None
+        assert second[0].time_taken == first[0].time_taken
+
+    @pytest.mark.asyncio
+    async def test_get_results__node_local(self, run_checks):
+        """Run node-local checks in every process and keep the order of checks."""
+        fleet_cache = FleetCache()
+        checks = [NodeCheck(), SharedCheck()]
+        await fleet_cache.get_results(checks, run_checks)
+        results = await fleet_cache.get_results(checks, run_checks)
+        assert [result.check for result in results] == checks
+        assert run_checks.runs.count([checks[0]]) == 2
+        assert run_checks.runs.count([checks[1]]) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_results__expired(self, run_checks):
+        """Refresh results older than the maximum age."""
+        fleet_cache = FleetCache(max_age=datetime.timedelta(0))
+        await fleet_cache.get_results([SharedCheck()], run_checks)
+        await fleet_cache.get_results([SharedCheck()], run_checks)
+        assert len(run_checks.runs) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_results__lease_taken_stale(self, run_checks):
+        """Read stale results while another process holds the lease."""
+        fleet_cache = FleetCache(max_age=datetime.timedelta(0))
+        await fleet_cache.get_results([SharedCheck()], run_checks)
+        key = fleet_cache.get_key([SharedCheck()])
+        await cache.aset(f"{key}:lease", True)
+        results = await fleet_cache.get_results([SharedCheck()], run_checks)
+        assert len(run_checks.runs) == 1
+        assert results[0].error is None
+
+    @pytest.mark.asyncio
+    async def test_get_results__lease_taken_empty(self, run_checks):
+        """Run checks without storing them while another process holds the lease."""
+        fleet_cache = FleetCache()
+        key = fleet_cache.get_key([SharedCheck()])
+        await cache.aset(f"{key}:lease", True)
+        await fleet_cache.get_results([SharedCheck()], run_checks)
+        assert len(run_checks.runs) == 1
+        assert await cache.aget(key) is None
+
+    @pytest.mark.asyncio
+    async def test_get_results__different_checks(self, run_checks):
+        """Do not share results between different checks."""
+        fleet_cache = FleetCache()
+        await fleet_cache.get_results([SharedCheck(name="a")], run_checks)
+        await fleet_cache.get_results([SharedCheck(name="b")], run_checks)
+        assert len(run_checks.runs) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_results__cache_error(self, run_checks):
+        """Run checks in the process if the cache is unavailable."""
+        fleet_cache = FleetCache()
+        with mock.patch.object(cache, "aget", side_effect=ConnectionError):
+            results = await fleet_cache.get_results([SharedCheck()], run_checks)
+        assert len(run_checks.runs) == 1
+        assert results[0].error is None
+
+    @pytest.mark.asyncio
+    async def test_get_results__pickle(self, run_checks):
+        """Support custom serializers."""
+        fleet_cache = FleetCache(serializer=pickle)
+        await fleet_cache.get_results([SharedCheck()], run_checks)
+        await fleet_cache.get_results([SharedCheck()], run_checks)
+        assert len(run_checks.runs) == 1
+
+    def test_dump_results__load_results(self):
+        """Restore errors with their type, message and timestamp."""
+        check = SharedCheck()
+        timestamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        results = [
+            HealthCheckResult(
+                check=check,
+                error=ServiceWarning("so so", timestamp=timestamp),
+                time_taken=1.5,
+                queued_seconds=0.5,
+                run_seconds=1.0,
+                cpu_seconds=0.25,
+                phases={"connect": 0.5},
+            )
+        ]
+        data = FleetCache.dump_results(results)
+        assert data["created_at"] <= time.time()
+        (result,) = FleetCache.load_results(data, [check])
+        assert result.check is check
+        assert isinstance(result.error, ServiceWarning)
+        assert str(result.error) == "Warning: so so"
+        assert result.error.timestamp == timestamp
+        assert result.time_taken == 1.5
+        assert result.queued_seconds == 0.5
+        assert result.run_seconds == 1.0
+        assert result.cpu_seconds == 0.25
+        assert result.phases == {"connect": 0.5}
+
+    @pytest.mark.parametrize(
+        "error_type",
+        ["does.not.Exist", "datetime.datetime", f"{__name__}.CustomError"],
+    )
+    def test_load_error(self, error_type):
+        """Restore unknown error types as generic health check exceptions."""
+        error = FleetCache.load_error(
+            {
+                "type": error_type,
+                "message": "msg",
+                "timestamp": "2024-01-01T00:00:00+00:00",
+            }
+        )
+        assert isinstance(error, HealthCheckException)
+        assert error.message == "msg"
+        assert isinstance(error, CustomError) == error_type.endswith("CustomError")
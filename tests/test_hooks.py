@@ -0,0 +1,122 @@
+"""Unit tests for health_check.hooks module."""
+
+import datetime
+import threading
+
+import pytest
+
+from health_check import hooks
+from health_check.base import HealthCheck
+from health_check.exceptions import ServiceUnavailable
+from health_check.hooks import HookDispatcher, check_finished, check_started
+
+
+class SuccessCheck(HealthCheck):
+    async def run(self):
+        pass
+
+
+class FailingCheck(HealthCheck):
+    async def run(self):
+        raise ServiceUnavailable("down")
+
+
+@pytest.fixture
+def received():
+    """Collect the signals sent for checks of this module."""
+    calls = []
+
+    def receiver(signal, **kwargs):
+        calls.append((signal, kwargs))
+
+    for signal in (check_started, check_finished):
+        for sender in (SuccessCheck, FailingCheck):
+            signal.connect(receiver, sender=sender, weak=False)
+    yield calls
+    for signal in (check_started, check_finished):
+        for sender in (SuccessCheck, FailingCheck):
+            signal.disconnect(receiver, sender=sender)
+
+
+class TestHookDispatcher:
+    def test_send__no_receivers(self):
+        """Skip signals without receivers and don't start the thread."""
+        dispatcher = HookDispatcher()
+        dispatcher.send(check_started, SuccessCheck())
+        assert dispatcher.queue.empty()
+        assert dispatcher.thread is None
+
+    def test_send__receiver_called_in_thread(self, received):
+        """Call receivers in a background thread with the check and its labels."""
+        dispatcher = HookDispatcher()
+        check = SuccessCheck()
+        dispatcher.send(check_started, check, started_at=None)
+        dispatcher.queue.join()
+        ((signal, kwargs),) = received
+        assert signal is check_started
+        assert kwargs["sender"] is SuccessCheck
+        assert kwargs["check"] is check
+        assert kwargs["labels"] == {"check": "SuccessCheck"}
+        assert dispatcher.thread.name == "health_check_hooks"
+
+    def test_send__labels_read_only(self, received):
+        """Don't let receivers change the labels shared with the metrics."""
+        dispatcher = HookDispatcher()
+        check = SuccessCheck()
+        dispatcher.send(check_started, check, started_at=None)
+        dispatcher.queue.join()
+        ((_, kwargs),) = received
+        with pytest.raises(TypeError):
+            kwargs["labels"]["check"] = "OtherCheck"
+        assert check.labels == {"check": "SuccessCheck"}
+
+    def test_send__drop_when_full(self):
+        """Drop and count signals while the receivers can't keep up."""
+        release = threading.Event()
+
+        def slow_receiver(**kwargs):
+            release.wait(10)
+
+        check_started.connect(slow_receiver, sender=SuccessCheck, weak=False)
+        dispatcher = HookDispatcher(maxsize=1)
+        try:
+            for _ in range(5):
+                dispatcher.send(check_started, SuccessCheck())
+            assert 3 <= dispatcher.dropped <= 4
+        finally:
+            release.set()
+            check_started.disconnect(slow_receiver, sender=SuccessCheck)
+        dispatcher.queue.join()
+
+    def test_send__receiver_error(self, received):
+        """Keep sending signals after a receiver failed."""
+
+        def failing_receiver(**kwargs):
+            raise RuntimeError("boom")
+
+        check_started.connect(failing_receiver, sender=SuccessCheck, weak=False)
+        dispatcher = HookDispatcher()
+        try:
+            dispatcher.send(check_started, SuccessCheck())
+            dispatcher.send(check_started, SuccessCheck())
+            dispatcher.queue.join()
+        finally:
+            check_started.disconnect(failing_receiver, sender=SuccessCheck)
+        assert len(received) == 2
+
+
+class TestGetResult:
+    @pytest.mark.asyncio
+    async def test_get_result__signals(self, received):
+        """Send a signal before and after the check is run."""
+        check = FailingCheck()
+        result = await check.get_result()
+        hooks.dispatcher.queue.join()
+        (started_signal, started), (finished_signal, finished) = received
+        assert started_signal is check_started
+        assert finished_signal is check_finished
+        assert isinstance(started["started_at"], datetime.datetime)
+        assert finished["started_at"] == started["started_at"]
+        assert finished["result"] is result
+        assert finished["error"] is result.error
+        assert isinstance(finished["error"], ServiceUnavailable)
@@ -344,6 +344,34 @@ class TestHealthCheckCommand:
         # Should display the error message from the failing check
         assert "Test failure" in output or "AlwaysFailingCheck" in output
 
+    @pytest.mark.django_db
+    def test_handle__trace_allocations(self):
+        """Report the memory allocated by each check with --trace-allocations."""
+        stdout = StringIO()
+        with pytest.raises(SystemExit) as exc_info:
+            call_command(
+                "health_check",
+                "health_check_test",
+                trace_allocations=True,
+                stdout=stdout,
+            )
+        assert exc_info.value.code == 0
+        assert "net: " in stdout.getvalue()
+        assert "peak: " in stdout.getvalue()
+
+    def test_handle__trace_allocations_failure(self):
+        """Return exit code 1 when checks fail with --trace-allocations."""
+        stdout = StringIO()
+        with pytest.raises(SystemExit) as exc_info:
+            call_command(
+                "health_check",
+                "health_check_fail",
+                trace_allocations=True,
+                stdout=stdout,
+            )
+        assert exc_info.value.code == 1
+        assert "AlwaysFailingCheck" in stdout.getvalue()
+
     def test_handle__html_flag_uses_http_server(self, live_server):
         """Run checks via HTTP server when --http is explicitly provided."""
         parsed = urlparse(live_server.url)
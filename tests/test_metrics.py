@@ -0,0 +1,60 @@
+"""Unit tests for health_check.metrics module."""
+
+import math
+
+from health_check.metrics import DEFAULT_BUCKETS, Histogram, HistogramFamily
+
+
+class TestHistogram:
+    def test_init__empty(self):
+        """Start without any observed values."""
+        histogram = Histogram()
+        assert histogram.count == 0
+        assert histogram.sum == 0
+        assert len(histogram.counts) == len(DEFAULT_BUCKETS) + 1
+
+    def test_observe__upper_bound_inclusive(self):
+        """Count values equal to a bound in that bound's bucket."""
+        histogram = Histogram((0.1, 1.0))
+        histogram.observe(0.1)
+        assert list(histogram.counts) == [1, 0, 0]
+
+    def test_observe__overflow(self):
+        """Count values above all bounds in the overflow bucket."""
+        histogram = Histogram((0.1, 1.0))
+        histogram.observe(5)
+        assert list(histogram.counts) == [0, 0, 1]
+
+    def test_observe__sum_and_count(self):
+        """Add up the observed values."""
+        histogram = Histogram((0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        assert histogram.count == 2
+        assert histogram.sum == 0.55
+
+    def test_cumulative_counts(self):
+        """Yield counts of all values less than or equal to each bound."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 2):
+            histogram.observe(value)
+        assert list(histogram.cumulative_counts()) == [
+            (0.1, 1),
+            (1.0, 3),
+            (math.inf, 4),
+        ]
+
+
+class TestHistogramFamily:
+    def test_observe__separate_histograms(self):
+        """Keep a histogram for each key."""
+        family = HistogramFamily(buckets=(1.0,))
+        family.observe("a", 0.5)
+        family.observe("a", 0.5)
+        family.observe("b", 2)
+        assert family.get("a").count == 2
+        assert list(family.get("b").counts) == [0, 1]
+
+    def test_get__unknown_key(self):
+        """Return None for keys without observed values."""
+        assert HistogramFamily().get("missing") is None
@@ -0,0 +1,153 @@
+"""Unit tests for health_check.profiling module."""
+
+import asyncio
+import concurrent.futures
+import datetime
+import time
+import tracemalloc
+
+import pytest
+
+from health_check.base import HealthCheck
+from health_check.exceptions import ServiceUnavailable
+from health_check.profiling import (
+    ProfilerBusy,
+    ProfilingExecutor,
+    _lock,
+    profile_check,
+    profile_checks,
+    trace_allocations,
+    trace_check,
+)
+
+
+def busy_wait():
+    deadline = time.perf_counter() + 0.02
+    while time.perf_counter() < deadline:
+        pass
+
+
+class AsyncCheck(HealthCheck):
+    async def run(self):
+        busy_wait()
+
+
+class SyncCheck(HealthCheck):
+    def run(self):
+        busy_wait()
+
+
+class FailingCheck(HealthCheck):
+    async def run(self):
+        raise ServiceUnavailable("down")
+
+
+class LeakingCheck(HealthCheck):
+    leaked = []
+
+    def run(self):
+        self.leaked.append(bytearray(100_000))
+
+
+class TestProfilingExecutor:
+    def test_submit__profile_call(self):
+        """Record a profile for each call run in the wrapped executor."""
+        with concurrent.futures.ThreadPoolExecutor(1) as thread_pool:
+            executor = ProfilingExecutor(thread_pool)
+            assert executor.submit(sum, [1, 2]).result() == 3
+        assert len(executor.profilers) == 1
+
+
+class TestProfileCheck:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("check_class", [AsyncCheck, SyncCheck])
+    async def test_profile_check(self, check_class):
+        """Return the check's result with the functions it spent the most time in."""
+        with concurrent.futures.ThreadPoolExecutor(1) as thread_pool:
+            profile = await profile_check(check_class(), thread_pool, limit=3)
+        assert profile.result.error is None
+        assert len(profile.frames) == 3
+        assert "busy_wait" in [frame.function for frame in profile.frames]
+        assert profile.frames == sorted(
+            profile.frames, key=lambda frame: frame.total_time, reverse=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_profile_check__error(self):
+        """Return the error of a failing check."""
+        with concurrent.futures.ThreadPoolExecutor(1) as thread_pool:
+            profile = await profile_check(FailingCheck(), thread_pool)
+        assert isinstance(profile.result.error, ServiceUnavailable)
+
+
+class TestProfileChecks:
+    @pytest.mark.asyncio
+    async def test_profile_checks(self):
+        """Return a profile for each check in order."""
+        profiles = await profile_checks([SyncCheck(), AsyncCheck()])
+        assert [type(profile.result.check) for profile in profiles] == [
+            SyncCheck,
+            AsyncCheck,
+        ]
+        assert not _lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_profile_checks__busy(self):
+        """Raise ProfilerBusy while another profile is being recorded."""
+        with _lock, pytest.raises(ProfilerBusy):
+            await profile_checks([AsyncCheck()])
+
+    @pytest.mark.asyncio
+    async def test_profile_checks__timeout(self):
+        """Report checks exceeding the timeout as unavailable."""
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(10)
+
+        (profile,) = await profile_checks(
+            [HangingCheck()], timeout=datetime.timedelta(milliseconds=10)
+        )
+        assert str(profile.result.error) == "Unavailable: timeout"
+
+
+class TestTraceCheck:
+    @pytest.mark.asyncio
+    async def test_trace_check(self):
+        """Return the memory the check allocated and didn't release."""
+        tracemalloc.start()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(1) as thread_pool:
+                allocations = await trace_check(LeakingCheck(), thread_pool, limit=1)
+        finally:
+            tracemalloc.stop()
+        assert allocations.result.error is None
+        assert allocations.net_bytes >= 100_000
+        assert allocations.peak_bytes >= 100_000
+        (site,) = allocations.sites
+        assert site.file == __file__
+        assert site.size >= 100_000
+
+
+class TestTraceAllocations:
+    @pytest.mark.asyncio
+    async def test_trace_allocations(self):
+        """Return the allocations of each check in order and stop tracing."""
+        allocations = await trace_allocations([LeakingCheck(), FailingCheck()])
+        assert [type(item.result.check) for item in allocations] == [
+            LeakingCheck,
+            FailingCheck,
+        ]
+        assert allocations[0].net_bytes >= 100_000
+        assert isinstance(allocations[1].result.error, ServiceUnavailable)
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.asyncio
+    async def test_trace_allocations__already_tracing(self):
+        """Keep tracing if it was started before."""
+        tracemalloc.start()
+        try:
+            await trace_allocations([AsyncCheck()])
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
@@ -0,0 +1,30 @@
+"""Unit tests for health_check.serializers module."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from health_check import serializers
+
+
+class TestDumps:
+    def test_dumps(self):
+        """Return compact JSON bytes."""
+        assert serializers.dumps({"status": "pass", "checks": {}}) == (
+            b'{"status":"pass","checks":{}}'
+        )
+
+    def test_dumps__without_orjson(self):
+        """Serialize with the standard library if orjson isn't installed."""
+        data = {"status": "pass", "observedValue": 0.5, "labels": {"check": "Ä"}}
+        with mock.patch.object(serializers, "orjson", None):
+            assert json.loads(serializers.dumps(data)) == data
+
+    def test_dumps__orjson(self):
+        """Serialize with orjson if it's installed."""
+        orjson = pytest.importorskip("orjson")
+        data = {"status": "pass", "observedValue": 0.5}
+        with mock.patch.object(orjson, "dumps", wraps=orjson.dumps) as dumps:
+            assert json.loads(serializers.dumps(data)) == data
+        dumps.assert_called_once_with(data)
@@ -0,0 +1,339 @@
+import asyncio
+import datetime
+import time
+
+import pytest
+
+from health_check.base import HealthCheck, HealthCheckResult
+from health_check.exceptions import ServiceUnavailable
+from health_check.snapshot import Snapshot, SnapshotCache
+
+
+class FastCheck(HealthCheck):
+    refresh_interval = datetime.timedelta(milliseconds=1)
+
+    async def run(self):
+        pass
+
+
+class SlowCheck(HealthCheck):
+    async def run(self):
+        pass
+
+
+class TestSnapshot:
+    def test_age(self):
+        """Age is the time passed since creation."""
+        snapshot = Snapshot(results=[], created_at=time.monotonic() - 10)
+        assert snapshot.age >= datetime.timedelta(seconds=10)
+
+    def test_digest(self):
+        """Change the digest with the status of a check, but not its timings."""
+        check = SlowCheck()
+        digest = Snapshot(
+            results=[HealthCheckResult(check=check, error=None, time_taken=1)]
+        ).digest
+        assert (
+            Snapshot(
+                results=[HealthCheckResult(check=check, error=None, time_taken=2)]
+            ).digest
+            == digest
+        )
+        assert (
+            Snapshot(
+                results=[
+                    HealthCheckResult(
+                        check=check, error=ServiceUnavailable("down"), time_taken=1
+                    )
+                ]
+            ).digest
+            != digest
+        )
+
+
+class TestSnapshotCache:
+    @pytest.fixture
+    def run_checks(self):
+        calls = []
+
+        async def run_checks():
+            calls.append(None)
+            return [len(calls)]
+
+        run_checks.calls = calls
+        return run_checks
+
+    @pytest.mark.asyncio
+    async def test_get__empty(self, run_checks):
+        """Run checks when no snapshot exists."""
+        cache = SnapshotCache()
+        snapshot = await cache.get(
+            run_checks,
+            max_age=datetime.timedelta(minutes=1),
+            stale_while_revalidate=datetime.timedelta(0),
+        )
+        assert snapshot.results == [1]
+        assert cache.snapshot is snapshot
+
+    @pytest.mark.asyncio
+    async def test_get__fresh(self, run_checks):
+        """Serve fresh snapshots without running the checks."""
+        cache = SnapshotCache(snapshot=Snapshot(results=[0]))
+        snapshot = await cache.get(
+            run_checks,
+            max_age=datetime.timedelta(minutes=1),
+            stale_while_revalidate=datetime.timedelta(0),
+        )
+        assert snapshot.results == [0]
+        assert not run_checks.calls
+
+    @pytest.mark.asyncio
+    async def test_get__stale(self, run_checks):
+        """Serve stale snapshots and refresh them in the background."""
+        cache = SnapshotCache(
+            snapshot=Snapshot(results=[0], created_at=time.monotonic() - 90)
+        )
+        snapshot = await cache.get(
+            run_checks,
+            max_age=datetime.timedelta(minutes=1),
+            stale_while_revalidate=datetime.timedelta(minutes=1),
+        )
+        assert snapshot.results == [0]
+        await cache.refresh_task
+        assert cache.snapshot.results == [1]
+
+    @pytest.mark.asyncio
+    async def test_get__stale_single_refresh(self, run_checks):
+        """Start only one background refresh at a time."""
+        cache = SnapshotCache(
+            snapshot=Snapshot(results=[0], created_at=time.monotonic() - 90)
+        )
+        for _ in range(3):
+            await cache.get(
+                run_checks,
+                max_age=datetime.timedelta(minutes=1),
+                stale_while_revalidate=datetime.timedelta(minutes=1),
+            )
+        await cache.refresh_task
+        assert run_checks.calls == [None]
+
+    @pytest.mark.asyncio
+    async def test_get__expired(self, run_checks):
+        """Replace snapshots older than the stale window before serving."""
+        cache = SnapshotCache(
+            snapshot=Snapshot(results=[0], created_at=time.monotonic() - 150)
+        )
+        snapshot = await cache.get(
+            run_checks,
+            max_age=datetime.timedelta(minutes=1),
+            stale_while_revalidate=datetime.timedelta(minutes=1),
+        )
+        assert snapshot.results == [1]
+        assert cache.refresh_task.done()
+
+    @pytest.mark.asyncio
+    async def test_refresh__concurrent(self):
+        """Share one pending run of the checks between concurrent callers."""
+        calls = []
+
+        async def run_checks():
+            calls.append(None)
+            await asyncio.sleep(0.01)
+            return [len(calls)]
+
+        cache = SnapshotCache()
+        snapshots = await asyncio.gather(*(cache.refresh(run_checks) for _ in range(5)))
+        assert calls == [None]
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+    @pytest.mark.asyncio
+    async def test_refresh__sequential(self, run_checks):
+        """Run the checks again once the pending run finished."""
+        cache = SnapshotCache()
+        await cache.refresh(run_checks)
+        snapshot = await cache.refresh(run_checks)
+        assert snapshot.results == [2]
+
+    @pytest.mark.asyncio
+    async def test_refresh__cancelled_caller(self):
+        """Keep the shared run going when one of the callers is cancelled."""
+
+        async def run_checks():
+            await asyncio.sleep(0.01)
+            return []
+
+        cache = SnapshotCache()
+        leader = asyncio.create_task(cache.refresh(run_checks))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.refresh(run_checks))
+        leader.cancel()
+        snapshot = await follower
+        assert snapshot.results == []
+
+    @pytest.fixture
+    def scheduled_checks(self):
+        runs = []
+
+        async def run_check(check):
+            runs.append(type(check))
+            return await check.get_result()
+
+        async def run_checks():
+            return [await run_check(FastCheck()), await run_check(SlowCheck())]
+
+        run_checks.runs = runs
+        return run_checks, run_check
+
+    @pytest.mark.asyncio
+    async def test_get_scheduled(self, scheduled_checks):
+        """Run all checks once and repeat each at its own interval."""
+        run_checks, run_check = scheduled_checks
+        cache = SnapshotCache()
+        snapshot = await cache.get_scheduled(
+            run_checks, run_check, refresh_interval=datetime.timedelta(hours=1)
+        )
+        try:
+            assert [type(result.check) for result in snapshot.results] == [
+                FastCheck,
+                SlowCheck,
+            ]
+            assert cache.is_scheduled
+            await asyncio.sleep(0.05)
+            assert run_checks.runs.count(FastCheck) > 2
+            assert run_checks.runs.count(SlowCheck) == 1
+            assert cache.snapshot is not snapshot
+            assert [type(result.check) for result in cache.snapshot.results] == [
+                FastCheck,
+                SlowCheck,
+            ]
+        finally:
+            for task in cache.scheduled_tasks:
+                task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_get_scheduled__reads_snapshot(self, scheduled_checks):
+        """Serve the latest snapshot without running the checks again."""
+        run_checks, run_check = scheduled_checks
+        cache = SnapshotCache()
+        try:
+            await asyncio.gather(
+                *(
+                    cache.get_scheduled(
+                        run_checks,
+                        run_check,
+                        refresh_interval=datetime.timedelta(hours=1),
+                    )
+                    for _ in range(3)
+                )
+            )
+            await cache.get_scheduled(
+                run_checks, run_check, refresh_interval=datetime.timedelta(hours=1)
+            )
+            assert len(cache.scheduled_tasks) == 2
+            assert run_checks.runs == [FastCheck, SlowCheck]
+        finally:
+            for task in cache.scheduled_tasks:
+                task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_get_scheduled__stale(self):
+        """Report checks as unavailable while a run exceeds twice their interval."""
+        release = asyncio.Event()
+
+        class HangingCheck(HealthCheck):
+            refresh_interval = datetime.timedelta(milliseconds=10)
+
+            async def run(self):
+                await release.wait()
+
+        async def run_check(check):
+            return await check.get_result()
+
+        async def run_checks():
+            return [HealthCheckResult(check=HangingCheck(), error=None, time_taken=0)]
+
+        cache = SnapshotCache()
+        await cache.get_scheduled(
+            run_checks, run_check, refresh_interval=datetime.timedelta(hours=1)
+        )
+        try:
+            await asyncio.sleep(0.05)
+            (result,) = cache.snapshot.results
+            assert str(result.error) == "Unavailable: stale"
+            release.set()
+            await asyncio.sleep(0.01)
+            (result,) = cache.snapshot.results
+            assert result.error is None
+        finally:
+            cache.unschedule()
+
+    @pytest.mark.asyncio
+    async def test_get_scheduled__reschedule(self, scheduled_checks):
+        """Cancel the remaining background runs before scheduling the checks again."""
+        run_checks, run_check = scheduled_checks
+        cache = SnapshotCache()
+        refresh_interval = datetime.timedelta(hours=1)
+        await cache.get_scheduled(
+            run_checks, run_check, refresh_interval=refresh_interval
+        )
+        try:
+            first, second = cache.scheduled_tasks
+            first.cancel()
+            await asyncio.sleep(0)
+            await cache.get_scheduled(
+                run_checks, run_check, refresh_interval=refresh_interval
+            )
+            await asyncio.sleep(0)
+            assert second.cancelled()
+            assert len(cache.scheduled_tasks) == 2
+            assert cache.is_scheduled
+        finally:
+            cache.unschedule()
+
+    @pytest.mark.asyncio
+    async def test_is_scheduled__not_started(self):
+        """Report checks as not scheduled before the first call."""
+        assert not SnapshotCache().is_scheduled
+
+    @pytest.mark.asyncio
+    async def test_subscribe(self, run_checks):
+        """Send new snapshots to subscribers until they unsubscribe."""
+        cache = SnapshotCache()
+        queue = cache.subscribe()
+        snapshot = await cache.refresh(run_checks)
+        assert queue.get_nowait() is snapshot
+        cache.unsubscribe(queue)
+        await cache.refresh(run_checks)
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_subscribe__latest_only(self, run_checks):
+        """Keep only the latest snapshot for slow subscribers."""
+        cache = SnapshotCache()
+        queue = cache.subscribe()
+        await cache.refresh(run_checks)
+        latest = await cache.refresh(run_checks)
+        assert queue.qsize() == 1
+        assert queue.get_nowait() is latest
+
+    def test_subscribe__unreferenced(self):
+        """Drop subscriptions of queues that are no longer referenced."""
+        cache = SnapshotCache()
+        cache.subscribe()
+        assert not cache.subscribers
+
+    @pytest.mark.asyncio
+    async def test_subscribe__scheduled(self, scheduled_checks):
+        """Send the snapshots of scheduled runs to subscribers."""
+        run_checks, run_check = scheduled_checks
+        cache = SnapshotCache()
+        queue = cache.subscribe()
+        try:
+            snapshot = await cache.get_scheduled(
+                run_checks, run_check, refresh_interval=datetime.timedelta(hours=1)
+            )
+            assert queue.get_nowait() is snapshot
+            assert await asyncio.wait_for(queue.get(), timeout=1) is not snapshot
+        finally:
+            for task in cache.scheduled_tasks:
+                task.cancel()
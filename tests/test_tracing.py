@@ -0,0 +1,128 @@
+"""Unit tests for health_check.tracing module."""
+
+import contextlib
+import dataclasses
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("opentelemetry")
+
+from opentelemetry import trace
+
+from health_check import tracing
+from health_check.base import HealthCheck
+from health_check.exceptions import ServiceUnavailable
+from health_check.views import HealthCheckView
+
+
+@dataclasses.dataclass
+class SuccessCheck(HealthCheck):
+    alias: str = "default"
+
+    async def run(self):
+        pass
+
+
+class FailingCheck(HealthCheck):
+    async def run(self):
+        raise ServiceUnavailable("down")
+
+
+@pytest.fixture
+def tracer():
+    with mock.patch.object(tracing, "tracer") as tracer:
+        yield tracer
+
+
+class TestGetResult:
+    @pytest.mark.asyncio
+    async def test_get_result__span(self, tracer):
+        """Run the check in a span with the check's labels as attributes."""
+        check = SuccessCheck()
+        result = await tracing.get_result(check, check.get_result)
+        assert result.error is None
+        tracer.start_as_current_span.assert_called_once_with(
+            "health_check SuccessCheck",
+            attributes={
+                "health_check.check": "SuccessCheck",
+                "health_check.alias": "default",
+            },
+        )
+        span = tracer.start_as_current_span.return_value.__enter__.return_value
+        span.set_attribute.assert_called_once_with(
+            "health_check.time_taken", result.time_taken
+        )
+        span.record_exception.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_result__error(self, tracer):
+        """Record the check's error as an exception event."""
+        check = FailingCheck()
+        result = await tracing.get_result(check, check.get_result)
+        span = tracer.start_as_current_span.return_value.__enter__.return_value
+        span.record_exception.assert_called_once_with(result.error)
+        span.set_status.assert_called_once_with(
+            trace.StatusCode.ERROR, "Unavailable: down"
+        )
+
+
+class TestStartAsCurrentSpan:
+    def test_start_as_current_span(self, tracer):
+        """Start a span with the given name."""
+        assert (
+            tracing.start_as_current_span("health_check /health/")
+            is tracer.start_as_current_span.return_value
+        )
+        tracer.start_as_current_span.assert_called_once_with("health_check /health/")
+
+    def test_start_as_current_span__disabled(self):
+        """Return a no-op context manager if OpenTelemetry isn't installed."""
+        with mock.patch.object(tracing, "tracer", None):
+            assert isinstance(
+                tracing.start_as_current_span("health_check /health/"),
+                contextlib.nullcontext,
+            )
+
+
+class TestHealthCheckView:
+    @pytest.mark.asyncio
+    async def test_gather_results__span_per_check(self, tracer):
+        """Run each check in its own span."""
+        view = HealthCheckView(checks=[SuccessCheck, FailingCheck])
+        await view.gather_results(view.get_checks())
+        assert [
+            call.args[0] for call in tracer.start_as_current_span.call_args_list
+        ] == ["health_check SuccessCheck", "health_check FailingCheck"]
+
+    @pytest.mark.asyncio
+    async def test_gather_results__disabled(self):
+        """Run checks without spans if OpenTelemetry isn't installed."""
+        view = HealthCheckView(checks=[SuccessCheck])
+        with (
+            mock.patch.object(tracing, "tracer", None),
+            mock.patch.object(tracing, "get_result") as get_result,
+        ):
+            (result,) = await view.gather_results(view.get_checks())
+        assert result.error is None
+        get_result.assert_not_called()
+
+
+class TestCommand:
+    def test_handle__no_http_span(self, tracer):
+        """Run the checks of the management command in a parent span."""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        with pytest.raises(SystemExit):
+            call_command(
+                "health_check",
+                "health_check_fail",
+                use_http=False,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+        assert tracer.start_as_current_span.call_args_list[0].args == (
+            "health_check /health/fail/",
+        )
@@ -1,4 +1,5 @@
 import dataclasses
+import datetime
 import json
 
 import pytest
@@ -6,6 +7,7 @@ import pytest
 from health_check.base import HealthCheck
 from health_check.exceptions import (
     HealthCheckException,
+    ServiceUnavailable,
     ServiceWarning,
     StatusPageWarning,
 )
@@ -209,7 +211,7 @@ class TestHealthCheckView:
         assert response.status_code == 406
         assert (
             response.content
-            == b"Not Acceptable: Supported content types: text/plain, text/html, application/json, application/atom+xml, application/rss+xml, application/openmetrics-text"
+            == b"Not Acceptable: Supported content types: text/plain, text/html, application/json, application/atom+xml, application/rss+xml, application/openmetrics-text, application/x-ndjson, application/health+json"
         )
 
     @pytest.mark.asyncio
@@ -271,6 +273,22 @@ class TestHealthCheckView:
         assert response["content-type"] == "application/json"
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_get__format_parameter_override__invalid_accept_header(
+        self, health_check_view
+    ):
+        """Format parameter doesn't depend on a valid Accept header."""
+
+        class SuccessBackend(HealthCheck):
+            async def run(self):
+                pass
+
+        response = await health_check_view(
+            [SuccessBackend], format_param="json", accept_header="garbage"
+        )
+        assert response["content-type"] == "application/json"
+        assert response.status_code == 200
+
     @pytest.mark.asyncio
     async def test_get__html_without_accept_header(self, health_check_view):
         """Return HTML by default without Accept header."""
@@ -750,6 +768,47 @@ class TestHealthCheckView:
             response.render()
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_as_view__compiled_checks(self):
+        """Instantiate checks once and reuse them across requests."""
+        from django.test import AsyncRequestFactory
+
+        instances = []
+
+        @dataclasses.dataclass
+        class TrackedCheck(HealthCheck):
+            def __post_init__(self):
+                instances.append(self)
+
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[TrackedCheck])
+        assert len(instances) == 1
+        factory = AsyncRequestFactory()
+        for _ in range(2):
+            response = await view(factory.get("/?format=json"))
+            assert response.status_code == 200
+        assert view.view_initkwargs["compiled_checks"] == (instances[0],)
+        assert len(instances) == 1
+
+    def test_as_view__invalid_check(self):
+        """Raise import errors when the view is created."""
+        with pytest.raises(ImportError):
+            HealthCheckView.as_view(checks=["health_check.checks.DoesNotExist"])
+
+    def test_as_view__default_checks(self):
+        """Compile the view's default checks."""
+        view = HealthCheckView.as_view()
+        assert [
+            type(check).__name__ for check in view.view_initkwargs["compiled_checks"]
+        ] == ["Cache", "Database", "DNS", "Mail", "Storage"]
+
+    def test_get_checks__not_compiled(self):
+        """Instantiate checks on demand without compiled checks."""
+        view = HealthCheckView(checks=["health_check.Storage"])
+        assert [type(check).__name__ for check in view.get_checks()] == ["Storage"]
+
     @pytest.mark.asyncio
     async def test_vary_header_on_accept(self, health_check_view):
         """Response includes Vary: Accept header for content negotiation."""
@@ -972,6 +1031,59 @@ class TestHealthCheckView:
         assert "# HELP django_health_check_overall_status" in content
         assert "# TYPE django_health_check_overall_status gauge" in content
 
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_latency_histogram(self, health_check_view):
+        """OpenMetrics include a response time histogram across all runs of the check."""
+
+        @dataclasses.dataclass
+        class HistogramCheck(HealthCheck):
+            name: str = "test_get__openmetrics_latency_histogram"
+
+            async def run(self):
+                pass
+
+        await health_check_view([HistogramCheck], format_param="openmetrics")
+        response = await health_check_view([HistogramCheck], format_param="openmetrics")
+        content = response.content.decode("utf-8")
+        labels = 'check="HistogramCheck",name="test_get__openmetrics_latency_histogram"'
+        assert "# TYPE django_health_check_latency_seconds histogram" in content
+        assert (
+            f'django_health_check_latency_seconds_bucket{{{labels},le="0.005"}} 2'
+            in content
+        )
+        assert (
+            f'django_health_check_latency_seconds_bucket{{{labels},le="+Inf"}} 2'
+            in content
+        )
+        assert f"django_health_check_latency_seconds_count{{{labels}}} 2" in content
+        assert f"django_health_check_latency_seconds_sum{{{labels}}} " in content
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_event_loop_lag(self, health_check_view):
+        """OpenMetrics include the event loop lag histogram of EventLoopLag checks."""
+        from health_check.checks import EventLoopLag
+
+        response = await health_check_view([EventLoopLag], format_param="openmetrics")
+        content = response.content.decode("utf-8")
+        assert "# TYPE django_health_check_event_loop_lag_seconds histogram" in content
+        assert (
+            'django_health_check_event_loop_lag_seconds_bucket{check="EventLoopLag",le="+Inf"}'
+            in content
+        )
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_no_event_loop_lag(self, health_check_view):
+        """OpenMetrics omit the event loop lag histogram without EventLoopLag checks."""
+
+        class SuccessBackend(HealthCheck):
+            async def run(self):
+                pass
+
+        response = await health_check_view([SuccessBackend], format_param="openmetrics")
+        assert "django_health_check_event_loop_lag_seconds" not in (
+            response.content.decode("utf-8")
+        )
+
     @pytest.mark.asyncio
     async def test_get__text_format_parameter(self, health_check_view):
         """Return plain text when format=text."""
@@ -1087,16 +1199,1439 @@ class TestHealthCheckView:
             response.render()
         assert response.status_code == 200
 
-    def test_abnf_escape(self):
-        assert HealthCheckView.abnf_escape("simple") == "simple"
+    @pytest.mark.asyncio
+    async def test_get__cache_timeout(self):
+        """Serve cached results without running the checks again."""
+        from django.test import AsyncRequestFactory
+
+        calls = []
+
+        class CountingCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+
+        view = HealthCheckView.as_view(
+            checks=[CountingCheck], cache_timeout=datetime.timedelta(minutes=1)
+        )
+        factory = AsyncRequestFactory()
+        for format_param in ["json", "text", "openmetrics"]:
+            response = await view(factory.get(f"/?format={format_param}"))
+            assert response.status_code == 200
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_get__cache_timeout_error_status(self):
+        """Return the status code of the cached results."""
+        from django.test import AsyncRequestFactory
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("Fail")
+
+        view = HealthCheckView.as_view(
+            checks=[FailingCheck], cache_timeout=datetime.timedelta(minutes=1)
+        )
+        factory = AsyncRequestFactory()
+        for _ in range(2):
+            response = await view(
+                factory.get("/", headers={"Accept": "application/json"})
+            )
+            assert response.status_code == 500
+            assert response["Vary"] == "Accept"
+
+    @pytest.mark.asyncio
+    async def test_get__cache_per_view(self):
+        """Do not share cached results between views."""
+        from django.test import AsyncRequestFactory
+
+        calls = []
+
+        class CountingCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+
+        factory = AsyncRequestFactory()
+        for _ in range(2):
+            view = HealthCheckView.as_view(
+                checks=[CountingCheck], cache_timeout=datetime.timedelta(minutes=1)
+            )
+            await view(factory.get("/?format=json"))
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_get__no_cache_timeout(self):
+        """Run the checks on every request by default."""
+        from django.test import AsyncRequestFactory
+
+        calls = []
+
+        class CountingCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+
+        view = HealthCheckView.as_view(checks=[CountingCheck])
+        factory = AsyncRequestFactory()
+        for _ in range(2):
+            await view(factory.get("/?format=json"))
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_get__concurrent_requests(self):
+        """Share one run of the checks between concurrent requests."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        calls = []
+
+        class SlowCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+                await asyncio.sleep(0.01)
+
+        view = HealthCheckView.as_view(checks=[SlowCheck])
+        factory = AsyncRequestFactory()
+        responses = await asyncio.gather(
+            *(view(factory.get("/?format=json")) for _ in range(5))
+        )
+        assert len(calls) == 1
+        assert all(response.status_code == 200 for response in responses)
+
+    @pytest.mark.asyncio
+    async def test_get__check_timeout(self):
+        """Report checks exceeding the check timeout as unavailable."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(10)
+
+        view = HealthCheckView.as_view(
+            checks=[HangingCheck], check_timeout=datetime.timedelta(milliseconds=10)
+        )
+        response = await view(AsyncRequestFactory().get("/?format=text"))
+        assert response.status_code == 500
+        assert b"Unavailable: timeout" in response.content
+
+    def test_get__check_timeout__wsgi(self):
+        """Respond within the timeout and don't pile up threads of hanging sync checks."""
+        import threading
+        import timeit
+
+        from asgiref.sync import async_to_sync
+        from django.test import AsyncRequestFactory
+
+        release = threading.Event()
+        calls = []
+
+        @dataclasses.dataclass
+        class HangingSyncCheck(HealthCheck):
+            def run(self):
+                calls.append(None)
+                release.wait(10)
+
+        view = async_to_sync(
+            HealthCheckView.as_view(
+                checks=[HangingSyncCheck],
+                check_timeout=datetime.timedelta(milliseconds=100),
+            )
+        )
+        factory = AsyncRequestFactory()
+        try:
+            for _ in range(2):
+                start = timeit.default_timer()
+                response = view(factory.get("/?format=json"))
+                assert timeit.default_timer() - start < 1
+                assert list(json.loads(response.content).values()) == [
+                    "Unavailable: timeout"
+                ]
+            assert len(calls) == 1
+        finally:
+            release.set()
+
+    @pytest.mark.asyncio
+    async def test_get__refresh_interval(self):
+        """Serve results of the checks running in the background."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        calls = []
+
+        class CountingCheck(HealthCheck):
+            def run(self):
+                calls.append(None)
+
+        view = HealthCheckView.as_view(
+            checks=[CountingCheck],
+            refresh_interval=datetime.timedelta(milliseconds=1),
+        )
+        snapshot_cache = view.view_initkwargs["snapshot_cache"]
+        factory = AsyncRequestFactory()
+        try:
+            response = await view(factory.get("/?format=json"))
+            assert response.status_code == 200
+            assert calls
+            await asyncio.sleep(0.05)
+            assert len(calls) > 1
+            response = await view(factory.get("/?format=json"))
+            assert response.status_code == 200
+        finally:
+            for task in snapshot_cache.scheduled_tasks:
+                task.cancel()
+
+    def test_get_executor__shared(self):
+        """Return the process-wide executor if the pool size is configured."""
+        from health_check.executor import get_shared_executor
+
+        view = HealthCheckView(executor_max_workers=2)
+        with view.get_executor() as executor:
+            assert executor is get_shared_executor(2)
+
+    @pytest.mark.asyncio
+    async def test_get__json_timings(self):
+        """Include the timings of each check in JSON if enabled."""
+        from django.test import AsyncRequestFactory
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    pass
+
+        view = HealthCheckView.as_view(checks=[PhasedCheck], json_timings=True)
+        response = await view(AsyncRequestFactory().get("/?format=json"))
+        assert response.status_code == 200
+        (value,) = json.loads(response.content).values()
+        assert value["status"] == "OK"
+        assert value["time_taken"] == pytest.approx(
+            value["queued_seconds"] + value["run_seconds"]
+        )
+        assert list(value["phases"]) == ["connect"]
+
+    @pytest.mark.asyncio
+    async def test_get__cpu_time(self):
+        """Include the CPU time of each check in JSON and OpenMetrics if enabled."""
+        from django.test import AsyncRequestFactory
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        view = HealthCheckView.as_view(
+            checks=[SyncCheck], cpu_time=True, json_timings=True
+        )
+        response = await view(AsyncRequestFactory().get("/?format=json"))
+        (value,) = json.loads(response.content).values()
+        assert value["cpu_seconds"] >= 0
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "# TYPE django_health_check_cpu_seconds gauge" in content
+        assert 'django_health_check_cpu_seconds{check="SyncCheck"} ' in content
+
+    @pytest.mark.asyncio
+    async def test_get__no_cpu_time(self):
+        """Omit the CPU time unless enabled."""
+        from django.test import AsyncRequestFactory
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SyncCheck], json_timings=True)
+        response = await view(AsyncRequestFactory().get("/?format=json"))
+        (value,) = json.loads(response.content).values()
+        assert value["cpu_seconds"] is None
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        assert "django_health_check_cpu_seconds" not in response.content.decode()
+
+    @pytest.mark.asyncio
+    async def test_get__json_no_timings(self):
+        """Report only the status of each check in JSON by default."""
+        from django.test import AsyncRequestFactory
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    pass
+
+        view = HealthCheckView.as_view(checks=[PhasedCheck])
+        response = await view(AsyncRequestFactory().get("/?format=json"))
+        assert list(json.loads(response.content).values()) == ["OK"]
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_phases(self):
+        """Include the time taken by the phases of each check in OpenMetrics."""
+        from django.test import AsyncRequestFactory
+
+        class PhasedCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    pass
+                with self.phase("query"):
+                    pass
+
+        view = HealthCheckView.as_view(checks=[PhasedCheck])
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "# TYPE django_health_check_phase_seconds gauge" in content
         assert (
-            HealthCheckView.abnf_escape(r"backslash\backslash")
-            == "backslash\\\\backslash"
+            'django_health_check_phase_seconds{check="PhasedCheck",phase="connect"} '
+            in content
+        )
+        assert (
+            'django_health_check_phase_seconds{check="PhasedCheck",phase="query"} '
+            in content
         )
-        assert HealthCheckView.abnf_escape('quote"test') == 'quote\\"test'
-        assert HealthCheckView.abnf_escape("line\nbreak") == "line\\nbreak"
 
-    def test_abnf_dumps(self):
-        assert HealthCheckView.abnf_dumps({"a": "b"}) == 'a="b"'
-        assert HealthCheckView.abnf_dumps({"a": "b", "c": "d"}) == 'a="b",c="d"'
-        assert HealthCheckView.abnf_dumps({"a": 'b"c'}) == 'a="b\\"c"'
+    @pytest.mark.asyncio
+    async def test_get__profile_internal_ip(self, settings):
+        """Return the profile of each check to clients from internal IPs."""
+        from django.test import AsyncRequestFactory
+
+        settings.INTERNAL_IPS = ["127.0.0.1"]
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck], profiling=True)
+        response = await view(AsyncRequestFactory().get("/?profile"))
+        assert response.status_code == 200
+        (value,) = json.loads(response.content).values()
+        assert value["status"] == "OK"
+        assert value["time_taken"] >= 0
+        assert value["frames"]
+        assert set(value["frames"][0]) == {
+            "function",
+            "file",
+            "line",
+            "calls",
+            "total_time",
+            "cumulative_time",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get__profile_secret(self, settings):
+        """Return the profile of each check to clients with the secret."""
+        from django.test import AsyncRequestFactory
+
+        settings.INTERNAL_IPS = []
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        view = HealthCheckView.as_view(
+            checks=[FailingCheck],
+            profiling=True,
+            profile_secret="s3cr3t",  # noqa: S106
+        )
+        response = await view(AsyncRequestFactory().get("/?profile=s3cr3t"))
+        assert response.status_code == 500
+        (value,) = json.loads(response.content).values()
+        assert value["status"] == "Unknown Error: down"
+        assert "frames" in value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "initkwargs, query",
+        [
+            ({}, "profile"),
+            ({"profiling": True}, "profile"),
+            ({"profiling": True, "profile_secret": "s3cr3t"}, "profile=wrong"),
+            ({"profiling": True, "profile_secret": ""}, "profile"),
+            ({"profiling": True, "profile_secret": ""}, "profile="),
+        ],
+    )
+    async def test_get__profile_denied(self, settings, initkwargs, query):
+        """Ignore the profile parameter unless profiling is enabled and allowed."""
+        from django.test import AsyncRequestFactory
+
+        settings.INTERNAL_IPS = []
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck], **initkwargs)
+        response = await view(AsyncRequestFactory().get(f"/?format=json&{query}"))
+        assert response.status_code == 200
+        assert list(json.loads(response.content).values()) == ["OK"]
+
+    @pytest.mark.asyncio
+    async def test_get__profile_busy(self, settings):
+        """Return service unavailable while another profile is being recorded."""
+        from django.test import AsyncRequestFactory
+
+        from health_check.profiling import _lock
+
+        settings.INTERNAL_IPS = ["127.0.0.1"]
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck], profiling=True)
+        with _lock:
+            response = await view(AsyncRequestFactory().get("/?profile"))
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_executor_stats(self, health_check_view):
+        """Include the shared executor's utilization in OpenMetrics."""
+        from django.test import AsyncRequestFactory
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SyncCheck], executor_max_workers=2)
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "django_health_check_executor_max_workers 2" in content
+        assert "django_health_check_executor_queued 0" in content
+        assert "django_health_check_executor_running 0" in content
+        assert content.endswith("# EOF\n")
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_no_executor_stats(self, health_check_view):
+        """Omit executor utilization when the default executor is used."""
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        response = await health_check_view([SyncCheck], format_param="openmetrics")
+        assert b"django_health_check_executor" not in response.content
+
+    @pytest.mark.asyncio
+    async def test_get__fleet_cache(self):
+        """Share results between views using the same fleet cache."""
+        from django.core.cache import cache
+        from django.test import AsyncRequestFactory
+
+        from health_check.fleet import FleetCache
+
+        calls = []
+
+        class CountingCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+
+        cache.clear()
+        factory = AsyncRequestFactory()
+        for _ in range(2):
+            view = HealthCheckView.as_view(
+                checks=[CountingCheck], fleet_cache=FleetCache()
+            )
+            response = await view(factory.get("/?format=json"))
+            assert response.status_code == 200
+        assert len(calls) == 1
+        cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_get__fleet_cache__refresh_interval(self):
+        """Share results of the background runs between views using the same fleet cache."""
+        import asyncio
+
+        from django.core.cache import cache
+        from django.test import AsyncRequestFactory
+
+        from health_check.fleet import FleetCache
+
+        calls = []
+
+        class CountingCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+
+        cache.clear()
+        fleet_cache = FleetCache(max_age=datetime.timedelta(seconds=60))
+        views = [
+            HealthCheckView.as_view(
+                checks=[CountingCheck],
+                fleet_cache=fleet_cache,
+                refresh_interval=datetime.timedelta(milliseconds=5),
+            )
+            for _ in range(2)
+        ]
+        factory = AsyncRequestFactory()
+        try:
+            for view in views:
+                response = await view(factory.get("/?format=json"))
+                assert response.status_code == 200
+            await asyncio.sleep(0.05)
+            assert len(calls) == 1
+        finally:
+            for view in views:
+                for task in view.view_initkwargs["snapshot_cache"].scheduled_tasks:
+                    task.cancel()
+            cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_get__circuit_breaker(self):
+        """Report open circuits in JSON and OpenMetrics."""
+        from django.test import AsyncRequestFactory
+
+        from health_check.circuit import CircuitBreaker
+
+        calls = []
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                calls.append(None)
+                raise HealthCheckException("down")
+
+        view = HealthCheckView.as_view(
+            checks=[FailingCheck],
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+        factory = AsyncRequestFactory()
+        response = await view(factory.get("/?format=json"))
+        assert list(json.loads(response.content).values()) == ["Unknown Error: down"]
+        response = await view(factory.get("/?format=json"))
+        assert response.status_code == 500
+        assert list(json.loads(response.content).values()) == [
+            "Circuit open: Unknown Error: down"
+        ]
+        response = await view(factory.get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "# TYPE django_health_check_circuit stateset" in content
+        assert (
+            'django_health_check_circuit{check="FailingCheck",django_health_check_circuit="open"} 1'
+            in content
+        )
+        assert (
+            'django_health_check_circuit{check="FailingCheck",django_health_check_circuit="closed"} 0'
+            in content
+        )
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["format=health", "format=ndjson"])
+    async def test_get__circuit_breaker_state(self, query):
+        """Report the state of each circuit in structured reports."""
+        from django.test import AsyncRequestFactory
+
+        from health_check.circuit import CircuitBreaker
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(
+            checks=[FailingCheck, SuccessCheck],
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+        response = await view(AsyncRequestFactory().get(f"/?{query}"))
+        content = (
+            b"".join([chunk async for chunk in response.streaming_content])
+            if response.streaming
+            else response.content
+        )
+        if query == "format=health":
+            checks = json.loads(content)["checks"]
+            states = {
+                name.split(":")[0]: details["circuit"]
+                for name, (details,) in checks.items()
+            }
+        else:
+            states = {
+                data["check"].rsplit(".", 1)[-1].removesuffix("()"): data["circuit"]
+                for data in map(json.loads, content.splitlines())
+                if "check" in data
+            }
+        assert states == {"FailingCheck": "open", "SuccessCheck": "closed"}
+
+    @pytest.mark.asyncio
+    async def test_get__circuit_breaker_state__json_timings(self):
+        """Report the state of each circuit in JSON with timings only."""
+        from django.test import AsyncRequestFactory
+
+        from health_check.circuit import CircuitBreaker
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        factory = AsyncRequestFactory()
+        view = HealthCheckView.as_view(
+            checks=[SuccessCheck],
+            circuit_breaker=CircuitBreaker(),
+            json_timings=True,
+        )
+        response = await view(factory.get("/?format=json"))
+        (details,) = json.loads(response.content).values()
+        assert details["circuit"] == "closed"
+        view = HealthCheckView.as_view(checks=[SuccessCheck], json_timings=True)
+        response = await view(factory.get("/?format=json"))
+        (details,) = json.loads(response.content).values()
+        assert "circuit" not in details
+
+    @pytest.mark.asyncio
+    async def test_get__concurrency_limit(self):
+        """Report the time checks waited for the concurrency limit in OpenMetrics."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        from health_check.concurrency import ConcurrencyLimit
+
+        class SlowCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(0.01)
+
+        view = HealthCheckView.as_view(
+            checks=[SlowCheck, SlowCheck],
+            concurrency_limit=ConcurrencyLimit(max_concurrency=1),
+        )
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "# TYPE django_health_check_queued_seconds gauge" in content
+        queued = sorted(
+            float(line.rsplit(" ", 1)[1])
+            for line in content.splitlines()
+            if line.startswith("django_health_check_queued_seconds{")
+        )
+        assert len(queued) == 2
+        assert queued[0] < 0.01 <= queued[1]
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_run_seconds(self):
+        """Include the run time of each check apart from its queue time in OpenMetrics."""
+        from django.test import AsyncRequestFactory
+
+        class SyncCheck(HealthCheck):
+            def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SyncCheck])
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "# TYPE django_health_check_queued_seconds gauge" in content
+        assert "# TYPE django_health_check_run_seconds gauge" in content
+        assert 'django_health_check_queued_seconds{check="SyncCheck"} ' in content
+        assert 'django_health_check_run_seconds{check="SyncCheck"} ' in content
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "format_param, status_code, skipped",
+        [
+            ("json", 500, b"Skipped: a critical check failed"),
+            ("text", 500, b"HangingCheck(): Skipped: a critical check failed"),
+            ("atom", 200, b"Skipped: a critical check failed"),
+            ("rss", 200, b"Skipped: a critical check failed"),
+            (
+                "openmetrics",
+                200,
+                b'django_health_check_skipped{check="HangingCheck"} 1',
+            ),
+            (None, 500, b"Skipped: a critical check failed"),
+        ],
+    )
+    async def test_get__fail_fast(self, format_param, status_code, skipped):
+        """Skip pending checks once a critical check failed."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(10)
+
+        view = HealthCheckView.as_view(
+            checks=[HangingCheck, FailingCheck], fail_fast=True
+        )
+        path = f"/?format={format_param}" if format_param else "/"
+        response = await asyncio.wait_for(
+            view(AsyncRequestFactory().get(path)), timeout=5
+        )
+        if hasattr(response, "render"):
+            response.render()
+        assert response.status_code == status_code
+        assert skipped in response.content
+
+    @pytest.mark.asyncio
+    async def test_get__fail_fast_non_critical(self):
+        """Keep running pending checks when a non-critical check failed."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        class NonCriticalCheck(HealthCheck):
+            critical = False
+
+            async def run(self):
+                raise HealthCheckException("down")
+
+        class SlowCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(0.01)
+
+        view = HealthCheckView.as_view(
+            checks=[SlowCheck, NonCriticalCheck], fail_fast=True
+        )
+        response = await view(AsyncRequestFactory().get("/?format=text"))
+        assert response.status_code == 500
+        assert b"SlowCheck(): OK" in response.content
+        assert b"Skipped" not in response.content
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format_param", ["text", "ndjson"])
+    async def test_get__fail_fast_warning(self, format_param):
+        """Keep running pending checks when a critical check reported a warning."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        class WarningCheck(HealthCheck):
+            async def run(self):
+                raise ServiceWarning("disk almost full")
+
+        class SlowCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(0.01)
+
+        view = HealthCheckView.as_view(checks=[SlowCheck, WarningCheck], fail_fast=True)
+        response = await view(AsyncRequestFactory().get(f"/?format={format_param}"))
+        content = (
+            b"".join([chunk async for chunk in response.streaming_content])
+            if response.streaming
+            else response.content
+        )
+        assert b"Warning: disk almost full" in content
+        assert b"Skipped" not in content
+
+    @pytest.mark.asyncio
+    async def test_get__fail_fast_success(self):
+        """Return all results when no check failed."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(
+            checks=[SuccessCheck, SuccessCheck], fail_fast=True
+        )
+        response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        content = response.content.decode()
+        assert "django_health_check_overall_status 1" in content
+        assert 'django_health_check_skipped{check="SuccessCheck"} 0' in content
+
+    def test_abnf_escape(self):
+        assert HealthCheckView.abnf_escape("simple") == "simple"
+        assert (
+            HealthCheckView.abnf_escape(r"backslash\backslash")
+            == "backslash\\\\backslash"
+        )
+        assert HealthCheckView.abnf_escape('quote"test') == 'quote\\"test'
+        assert HealthCheckView.abnf_escape("line\nbreak") == "line\\nbreak"
+
+    def test_abnf_dumps(self):
+        assert HealthCheckView.abnf_dumps({"a": "b"}) == 'a="b"'
+        assert HealthCheckView.abnf_dumps({"a": "b", "c": "d"}) == 'a="b",c="d"'
+        assert HealthCheckView.abnf_dumps({"a": 'b"c'}) == 'a="b\\"c"'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "accept_header, format_param",
+        [
+            (None, "ndjson"),
+            ("application/x-ndjson", None),
+        ],
+    )
+    async def test_get__ndjson(self, health_check_view, accept_header, format_param):
+        """Stream a JSON line per check in the order the checks finished."""
+        import asyncio
+
+        class SlowCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(0.05)
+
+        class FastCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        response = await health_check_view(
+            [SlowCheck, FastCheck],
+            accept_header=accept_header,
+            format_param=format_param,
+        )
+        assert response.status_code == 200
+        assert response["content-type"] == "application/x-ndjson"
+        assert response.streaming
+        lines = [json.loads(line) async for line in response.streaming_content]
+        assert lines[0]["check"].endswith(".FastCheck()")
+        assert lines[1]["check"].endswith(".SlowCheck()")
+        assert "check" not in lines[2]
+        assert lines[0]["status"] == "Unknown Error: down"
+        assert lines[1]["status"] == "OK"
+        assert lines[1]["time_taken"] >= 0.05
+        assert lines[2]["healthy"] is False
+        assert lines[2]["checks"] == 2
+        assert lines[2]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get__ndjson_first_result_before_slow_check(self):
+        """Send the result of a fast check while a slow check is still running."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        release = asyncio.Event()
+
+        class SlowCheck(HealthCheck):
+            async def run(self):
+                await release.wait()
+
+        class FastCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SlowCheck, FastCheck])
+        response = await view(AsyncRequestFactory().get("/?format=ndjson"))
+        content = aiter(response.streaming_content)
+        first = json.loads(await asyncio.wait_for(anext(content), timeout=5))
+        assert first["check"].endswith(".FastCheck()")
+        release.set()
+        assert json.loads(await anext(content))["check"].endswith(".SlowCheck()")
+
+    @pytest.mark.asyncio
+    async def test_get__ndjson_json_timings(self, health_check_view):
+        """Include the timings of each check in its line with json_timings."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck], json_timings=True)
+        response = await view(AsyncRequestFactory().get("/?format=ndjson"))
+        line, summary = [json.loads(line) async for line in response.streaming_content]
+        assert list(line["phases"]) == ["connect"]
+        assert "run_seconds" in line
+        assert summary["healthy"] is True
+
+    @pytest.mark.asyncio
+    async def test_get__ndjson_cached(self):
+        """Stream cached results without running the checks again."""
+        from django.test import AsyncRequestFactory
+
+        runs = []
+
+        class CountingCheck(HealthCheck):
+            async def run(self):
+                runs.append(None)
+
+        view = HealthCheckView.as_view(
+            checks=[CountingCheck], cache_timeout=datetime.timedelta(minutes=1)
+        )
+        for _ in range(2):
+            response = await view(AsyncRequestFactory().get("/?format=ndjson"))
+            lines = [json.loads(line) async for line in response.streaming_content]
+            assert lines[0]["status"] == "OK"
+        assert len(runs) == 1
+
+    @pytest.mark.asyncio
+    async def test_get__ndjson_fail_fast(self):
+        """Skip pending checks once a critical check failed while streaming."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                await asyncio.sleep(10)
+
+        view = HealthCheckView.as_view(
+            checks=[HangingCheck, FailingCheck], fail_fast=True
+        )
+        response = await view(AsyncRequestFactory().get("/?format=ndjson"))
+        lines = await asyncio.wait_for(
+            asyncio.ensure_future(
+                _collect(json.loads(line) async for line in response.streaming_content)
+            ),
+            timeout=5,
+        )
+        assert [line.get("status") for line in lines] == [
+            "Unknown Error: down",
+            "Skipped: a critical check failed",
+            None,
+        ]
+        assert lines[2]["errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get__ndjson_client_disconnected(self):
+        """Cancel pending checks when the client disconnected."""
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        cancelled = asyncio.Event()
+
+        class FastCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        class HangingCheck(HealthCheck):
+            async def run(self):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        view = HealthCheckView.as_view(checks=[HangingCheck, FastCheck])
+        response = await view(AsyncRequestFactory().get("/?format=ndjson"))
+        task = asyncio.ensure_future(_collect(response.streaming_content))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_get__ndjson_accept_fallback(self, health_check_view):
+        """Return NDJSON if it is the only supported type of the Accept header."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        response = await health_check_view(
+            [SuccessCheck], accept_header="image/png, application/x-ndjson;q=0.5"
+        )
+        assert response["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) async for line in response.streaming_content]
+        assert lines[0].keys() == {"check", "status", "time_taken"}
+        assert lines[0]["status"] == "OK"
+
+    @pytest.mark.asyncio
+    async def test_get__openmetrics_precompiled_labels(self):
+        """Escape the labels of the view's checks once instead of on every scrape."""
+        from unittest.mock import patch
+
+        from django.test import AsyncRequestFactory
+
+        @dataclasses.dataclass
+        class LabeledCheck(HealthCheck):
+            name: str = 'say "hi"'
+
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[LabeledCheck])
+        (check,) = view.view_initkwargs["compiled_checks"]
+        assert view.view_initkwargs["openmetrics_labels"] == {
+            id(check): 'check="LabeledCheck",name="say \\"hi\\""'
+        }
+        with patch.object(
+            HealthCheckView, "abnf_dumps", wraps=HealthCheckView.abnf_dumps
+        ) as abnf_dumps:
+            response = await view(AsyncRequestFactory().get("/?format=openmetrics"))
+        abnf_dumps.assert_not_called()
+        assert (
+            'django_health_check_status{check="LabeledCheck",name="say \\"hi\\""} 1'
+            in response.content.decode()
+        )
+
+    def test_get_openmetrics_labels__not_compiled(self):
+        """Escape the labels of checks that aren't precompiled."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        assert (
+            HealthCheckView().get_openmetrics_labels(SuccessCheck())
+            == 'check="SuccessCheck"'
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "accept_header, format_param",
+        [("application/health+json", None), (None, "health")],
+    )
+    async def test_get__health_json(
+        self, health_check_view, accept_header, format_param
+    ):
+        """Return each check's status, time taken, labels and error details."""
+
+        @dataclasses.dataclass
+        class SuccessCheck(HealthCheck):
+            alias: str = "default"
+
+            async def run(self):
+                pass
+
+        class WarningCheck(HealthCheck):
+            async def run(self):
+                raise ServiceWarning("slow")
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise ServiceUnavailable("down")
+
+        response = await health_check_view(
+            [SuccessCheck, WarningCheck, FailingCheck],
+            accept_header=accept_header,
+            format_param=format_param,
+        )
+        assert response.status_code == 500
+        assert response["content-type"] == "application/health+json"
+        data = json.loads(response.content)
+        assert data["status"] == "fail"
+        (success,) = data["checks"]["SuccessCheck:responseTime"]
+        assert success["status"] == "pass"
+        assert success["componentId"].endswith(".SuccessCheck(alias='default')")
+        assert success["observedUnit"] == "s"
+        assert success["observedValue"] >= 0
+        assert success["labels"] == {"check": "SuccessCheck", "alias": "default"}
+        assert "output" not in success
+        (warning,) = data["checks"]["WarningCheck:responseTime"]
+        assert warning["status"] == "warn"
+        (failure,) = data["checks"]["FailingCheck:responseTime"]
+        assert failure["status"] == "fail"
+        assert failure["output"] == "Unavailable: down"
+        assert failure["errorType"] == "health_check.exceptions.ServiceUnavailable"
+        assert datetime.datetime.fromisoformat(failure["time"])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error, status, status_code",
+        [
+            (None, "pass", 200),
+            (ServiceWarning("slow"), "warn", 200),
+            (ServiceUnavailable("down"), "fail", 500),
+        ],
+    )
+    async def test_get__health_json_status(
+        self, health_check_view, error, status, status_code
+    ):
+        """Report the most severe status of all checks and fail only on failures."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        class OtherCheck(HealthCheck):
+            async def run(self):
+                if error:
+                    raise error
+
+        response = await health_check_view(
+            [SuccessCheck, OtherCheck], format_param="health"
+        )
+        assert json.loads(response.content)["status"] == status
+        assert response.status_code == status_code
+
+    @pytest.mark.asyncio
+    async def test_get__health_json_instances(self, health_check_view):
+        """List multiple instances of the same check under the same key."""
+
+        @dataclasses.dataclass
+        class AliasCheck(HealthCheck):
+            alias: str = "default"
+
+            async def run(self):
+                pass
+
+        response = await health_check_view(
+            [(AliasCheck, {"alias": "a"}), (AliasCheck, {"alias": "b"})],
+            format_param="health",
+        )
+        component = json.loads(response.content)["checks"]["AliasCheck:responseTime"]
+        assert [details["labels"]["alias"] for details in component] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_get__health_json_timings(self):
+        """Include the timings of each check with json_timings."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                with self.phase("connect"):
+                    pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck], json_timings=True)
+        response = await view(AsyncRequestFactory().get("/?format=health"))
+        (details,) = json.loads(response.content)["checks"]["SuccessCheck:responseTime"]
+        assert list(details["phases"]) == ["connect"]
+        assert {"queuedSeconds", "runSeconds", "cpuSeconds"} <= details.keys()
+
+    @pytest.mark.asyncio
+    async def test_get__health_json_cached(self):
+        """Serialize cached results only once."""
+        from unittest.mock import Mock
+
+        from django.test import AsyncRequestFactory
+
+        from health_check import serializers
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        json_dumps = Mock(wraps=serializers.dumps)
+        view = HealthCheckView.as_view(
+            checks=[SuccessCheck],
+            cache_timeout=datetime.timedelta(minutes=1),
+            json_dumps=json_dumps,
+        )
+        responses = [
+            await view(AsyncRequestFactory().get("/?format=health")) for _ in range(2)
+        ]
+        assert responses[0].content == responses[1].content
+        json_dumps.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get__health_json_not_cached(self):
+        """Serialize the results of each run without a snapshot cache."""
+        from unittest.mock import Mock
+
+        from django.test import AsyncRequestFactory
+
+        from health_check import serializers
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        json_dumps = Mock(wraps=serializers.dumps)
+        view = HealthCheckView.as_view(checks=[SuccessCheck], json_dumps=json_dumps)
+        for _ in range(2):
+            await view(AsyncRequestFactory().get("/?format=health"))
+        assert json_dumps.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format_param", [None, "json", "text", "atom", "rss"])
+    async def test_get__etag(self, format_param):
+        """Answer requests with a matching ETag with 304 Not Modified."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(
+            checks=[SuccessCheck], cache_timeout=datetime.timedelta(minutes=1)
+        )
+        path = f"/?format={format_param}" if format_param else "/"
+        response = await view(AsyncRequestFactory().get(path))
+        assert response.status_code == 200
+        assert response["ETag"].startswith('W/"')
+        response = await view(
+            AsyncRequestFactory().get(path, headers={"If-None-Match": response["ETag"]})
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert "Accept" in response["Vary"]
+
+    @pytest.mark.asyncio
+    async def test_get__etag_excludes_timings(self):
+        """Keep the ETag if only the timings of the checks changed."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck])
+        first = await view(AsyncRequestFactory().get("/?format=json"))
+        second = await view(AsyncRequestFactory().get("/?format=json"))
+        assert first["ETag"] == second["ETag"]
+
+    @pytest.mark.asyncio
+    async def test_get__etag_status_changed(self):
+        """Change the ETag if the status of a check changed."""
+        from django.test import AsyncRequestFactory
+
+        healthy = [True]
+
+        class FlappingCheck(HealthCheck):
+            async def run(self):
+                if not healthy[0]:
+                    raise ServiceWarning("slow")
+
+        view = HealthCheckView.as_view(checks=[FlappingCheck])
+        etag = (await view(AsyncRequestFactory().get("/?format=rss")))["ETag"]
+        healthy[0] = False
+        response = await view(
+            AsyncRequestFactory().get("/?format=rss", headers={"If-None-Match": etag})
+        )
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_get__etag_per_format(self):
+        """Use different ETags for different formats of the same results."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck])
+        json_response = await view(AsyncRequestFactory().get("/?format=json"))
+        text_response = await view(AsyncRequestFactory().get("/?format=text"))
+        assert json_response["ETag"] != text_response["ETag"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format_param", ["openmetrics", "ndjson"])
+    async def test_get__etag_excluded_formats(self, format_param):
+        """Don't tag measurements and streams."""
+        from django.test import AsyncRequestFactory
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        view = HealthCheckView.as_view(checks=[SuccessCheck])
+        response = await view(AsyncRequestFactory().get(f"/?format={format_param}"))
+        assert response.status_code == 200
+        assert not response.has_header("ETag")
+
+    @pytest.mark.asyncio
+    async def test_get__etag_error(self, health_check_view):
+        """Always return the full response of failed checks."""
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        response = await health_check_view([FailingCheck], format_param="json")
+        assert response.status_code == 500
+        assert not response.has_header("ETag")
+
+    @pytest.mark.asyncio
+    async def test_get__cache_control(self, health_check_view):
+        """Let clients store responses only if they revalidate them."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        response = await health_check_view([SuccessCheck], format_param="json")
+        cache_control = {
+            directive.strip() for directive in response["Cache-Control"].split(",")
+        }
+        assert cache_control == {"max-age=0", "no-cache", "must-revalidate", "private"}
+
+
+class TestEventStream:
+    """Server-Sent Events of the results of the scheduled runs."""
+
+    @pytest.fixture
+    def view(self):
+        from health_check.views import HealthCheckView
+
+        views = []
+
+        def as_view(checks, **initkwargs):
+            view = HealthCheckView.as_view(
+                checks=checks,
+                refresh_interval=datetime.timedelta(milliseconds=10),
+                max_event_streams=2,
+                **initkwargs,
+            )
+            views.append(view)
+            return view
+
+        yield as_view
+        for view in views:
+            for task in view.view_initkwargs["snapshot_cache"].scheduled_tasks:
+                task.cancel()
+
+    @staticmethod
+    async def get(view, path="/", **headers):
+        from django.test import AsyncRequestFactory
+
+        return await view(
+            AsyncRequestFactory().get(
+                path, headers={"Accept": "text/event-stream", **headers}
+            )
+        )
+
+    @staticmethod
+    async def read_events(content, count):
+        import asyncio
+
+        events = []
+        while len(events) < count:
+            chunk = await asyncio.wait_for(anext(content), timeout=5)
+            events.append(chunk.decode())
+        return events
+
+    @staticmethod
+    def parse_event(event):
+        name, data = event.strip().split("\n")
+        return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path, headers",
+        [("/", {}), ("/?format=sse", {"Accept": "*/*"})],
+    )
+    async def test_get(self, view, path, headers):
+        """Send the results of all checks followed by a summary."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        class FailingCheck(HealthCheck):
+            async def run(self):
+                raise HealthCheckException("down")
+
+        response = await self.get(view([SuccessCheck, FailingCheck]), path, **headers)
+        assert response.status_code == 200
+        assert response["content-type"] == "text/event-stream"
+        assert response["X-Accel-Buffering"] == "no"
+        content = aiter(response.streaming_content)
+        events = [self.parse_event(e) for e in await self.read_events(content, 3)]
+        assert [name for name, _ in events] == ["result", "result", "summary"]
+        assert events[0][1]["status"] == "OK"
+        assert events[1][1]["status"] == "Unknown Error: down"
+        assert events[2][1] == {"healthy": False, "checks": 2, "errors": 1}
+        await content.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get__changes(self, view):
+        """Send only the results of checks whose status changed."""
+        healthy = [True]
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        class FlappingCheck(HealthCheck):
+            async def run(self):
+                if not healthy[0]:
+                    raise HealthCheckException("down")
+
+        response = await self.get(view([SuccessCheck, FlappingCheck]))
+        content = aiter(response.streaming_content)
+        await self.read_events(content, 3)
+        healthy[0] = False
+        events = [self.parse_event(e) for e in await self.read_events(content, 2)]
+        assert events[0][0] == "result"
+        assert events[0][1]["check"].endswith(".FlappingCheck()")
+        assert events[0][1]["status"] == "Unknown Error: down"
+        assert events[1] == ("summary", {"healthy": False, "checks": 2, "errors": 1})
+        await content.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get__heartbeat(self, view):
+        """Send a comment if no status changed within the heartbeat interval."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        response = await self.get(
+            view(
+                [SuccessCheck],
+                event_stream_heartbeat=datetime.timedelta(milliseconds=1),
+            )
+        )
+        content = aiter(response.streaming_content)
+        await self.read_events(content, 2)
+        assert await self.read_events(content, 1) == [": heartbeat\n\n"]
+        await content.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get__shared_run(self, view):
+        """Share a single run of the checks between all clients."""
+        runs = []
+
+        class CountingCheck(HealthCheck):
+            refresh_interval = datetime.timedelta(hours=1)
+
+            async def run(self):
+                runs.append(None)
+
+        health_view = view([CountingCheck])
+        contents = [
+            aiter((await self.get(health_view)).streaming_content) for _ in range(2)
+        ]
+        for content in contents:
+            await self.read_events(content, 2)
+        assert len(runs) == 1
+        for content in contents:
+            await content.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get__too_many_streams(self, view):
+        """Reject clients exceeding the maximum number of event streams."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        health_view = view([SuccessCheck])
+        responses = [await self.get(health_view) for _ in range(2)]
+        response = await self.get(health_view)
+        assert response.status_code == 503
+        assert response["Retry-After"] == "1"
+        assert response.content == b"Service Unavailable: Too many event streams"
+        del responses
+
+    @pytest.mark.asyncio
+    async def test_get__disconnected(self, view):
+        """Free the connection slot when the client disconnected."""
+        import asyncio
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        health_view = view([SuccessCheck])
+        snapshot_cache = health_view.view_initkwargs["snapshot_cache"]
+        response = await self.get(health_view)
+        task = asyncio.ensure_future(_collect(response.streaming_content))
+        await asyncio.sleep(0.05)
+        assert len(snapshot_cache.subscribers) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not snapshot_cache.subscribers
+
+    @pytest.mark.asyncio
+    async def test_get__disabled(self, health_check_view):
+        """Reject event streams unless they are enabled."""
+
+        class SuccessCheck(HealthCheck):
+            async def run(self):
+                pass
+
+        response = await health_check_view(
+            [SuccessCheck], accept_header="text/event-stream"
+        )
+        assert response.status_code == 406
+
+    def test_as_view__refresh_interval_required(self):
+        """Require a refresh interval to enable event streams."""
+        from django.core.exceptions import ImproperlyConfigured
+
+        from health_check.views import HealthCheckView
+
+        with pytest.raises(ImproperlyConfigured):
+            HealthCheckView.as_view(max_event_streams=10)
+
+
+async def _collect(iterable):
+    return [item async for item in iterable]